@@ -0,0 +1,124 @@
+'''
+    File name: BatchGrid.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+import Grid
+import Gridworlds
+
+class BatchGridworld:
+    """
+    Steps many copies of the same gridworld at once
+
+    Uses the same dictionary layout, reward function and state transition function as Grid.Gridworld,
+    but keeps the positions of all agents in one array, so one call of step moves every agent.
+    Finished episodes are reset to the starting state automatically.
+
+    ### Attributes:
+        n_envs (int>0) : amount of environments stepped in parallel
+        x_dim (int>0) : x dimension of gridworld
+        y_dim (int>0) : y dimension of gridworld
+        epsilon (0<float<1) : for epsilon-greedy state transition function
+        initial_agent (np.array(shape(2))) : [y,x] coordinates of the starting state
+        terminal (np.array(shape(2))) : [y,x] coordinates of the terminal state
+        action (list) : list of all the possible actions in order as strings
+        world (np.array(shape(y,x))) : values for all states being rewards and np.NaN for barriers
+        next_state (np.array(shape(y*x,len(action)))) : transition table of Grid.Gridworld (states as y*x_dim+x)
+        reward (np.array(shape(y*x,len(action)))) : reward table of Grid.Gridworld
+        agents (np.array(shape(n_envs))) : state index y*x_dim+x of all the agents
+        rng (numpy.random.Generator) : random numbers for the state transition function
+    """
+
+    def __init__(self,gridworld = Gridworlds.Gridworlds.GRIDWORLD1,n_envs = 1000,rng = None):
+        """
+        ### Arguments:
+            gridworld (dict or Grid.Gridworld) : layout of the gridworld, see Grid.Gridworld for the keys, or a Gridworld to copy
+            n_envs (int>0) : amount of environments stepped in parallel
+            rng (numpy.random.Generator, int or None) : generator or seed for the state transition function, None for a random seed
+        """
+
+        # let Gridworld parse the layout, so both use exactly the same world
+        template = gridworld if isinstance(gridworld, Grid.Gridworld) else Grid.Gridworld(gridworld)
+
+        self.n_envs = n_envs
+        self.rng = np.random.default_rng(rng)
+        self.x_dim = template.getXdim()
+        self.y_dim = template.getYdim()
+        self.epsilon = template.epsilon
+        self.initial_agent = np.array(template.initial_agent) # [y,x]
+        self.terminal = np.array(template.getTerminal()) # [y,x]
+        self.action = template.getActions()
+        self.world = template.world
+        self.next_state = template.next_state
+        self.reward = template.reward
+        self.initial_index = template.toIndex(template.initial_agent)
+        self.terminal_index = template.toIndex(template.getTerminal())
+
+        self.agents = np.empty(shape=(n_envs),dtype=int)
+        self.reset()
+
+    # getter
+    def getXdim(self):
+        return self.x_dim
+
+    def getYdim(self):
+        return self.y_dim
+
+    def getActions(self):
+        return self.action
+
+    def getTerminal(self):
+        return self.terminal # [y,x]
+
+    def getStates(self):
+        return self.toStates(self.agents) # [[y,x],[y,x],...]
+
+    def toStates(self,indices):
+        """
+        converts state indices y*x_dim+x into an array of [y,x] states
+        """
+        return np.stack(np.divmod(indices, self.x_dim), axis=-1)
+
+    # methods
+    def reset(self):
+        """
+        resets all environments to the initial state
+        """
+        self.agents[:] = self.initial_index
+        return self.getStates()
+
+    def step(self, actions):
+        """
+        applies the state transition dynamics and reward dynamics to all environments at once
+        environments that reach the terminal state are reset to the starting state afterwards
+
+        ### Arguments:
+            actions (np.array(shape(n_envs))) : [0,1,2,3] for ['up', 'down' , 'left' , 'right'] for each environment
+
+        ### return:
+            states (np.array(shape(n_envs,2))) : the new [y,x] state of each environment (before the reset)
+            rewards (np.array(shape(n_envs))) : reward of this step
+            terminals (np.array(shape(n_envs),dtype=bool)) : whether the new state is terminal
+        """
+
+        actions = np.asarray(actions)
+
+        # state transition policy: take a random action with probability epsilon
+        random_action = self.rng.random(self.n_envs) < self.epsilon
+        actions = np.where(random_action, self.rng.integers(len(self.action), size=self.n_envs), actions)
+
+        # look up new place and reward (invalid moves stay in place with -0.5)
+        rewards = self.reward[self.agents,actions]
+        self.agents = self.next_state[self.agents,actions]
+
+        terminals = self.agents == self.terminal_index
+        states = self.toStates(self.agents)
+
+        # start a new episode where the terminal was reached
+        self.agents[terminals] = self.initial_index
+
+        return states, rewards, terminals
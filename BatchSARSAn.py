@@ -0,0 +1,208 @@
+'''
+    File name: BatchSARSAn.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+import BatchGrid
+
+class BatchSARSAn:
+    """
+    Many independent n-step SARSA agents learning at once
+
+    Agent b has its own q-values q[b], its own copy of the gridworld (BatchGrid.BatchGridworld) and its own
+    epsilon, and does the same updates as SARSAn.episode (also the same order: one update n steps behind
+    each step, the remaining ones when the terminal state is reached). All agents make their steps together,
+    so the action selection, the steps and the updates are array operations over all agents.
+    Each agent starts its next episode as soon as it reached the terminal state, agents that did all
+    their episodes wait for the others. Only finite n, nothing is visualized.
+
+    ### Attributes:
+        n_agents (int > 0) : amount of agents B
+        n (int > 0) : amounts of steps
+        epsilon (np.array(shape(B))) : for the epsilon-greedy policy of each agent
+        decreasing_epsilon (bool) : if true decreasing epsilon after each episode like SARSAn
+        gamma (0<= float <= 1) : discount for future rewards
+        alpha (0<= float <= 1) : stepsize (learning rate)
+        environments (BatchGrid.BatchGridworld) : one gridworld for each agent
+        random (numpy.random.Generator) : random numbers for the policy and the initialization of q
+        q (np.array(shape(B , len(action) , y , x))) : the q-values of all agents
+    """
+
+    def __init__(self,gridworld,n_agents = 100,n = 10,epsilon = 0.5,decreasing_epsilon = False,gamma = 0.99,alpha = 0.3,rng = None):
+        """
+        ### Arguments:
+            gridworld (dict or Grid.Gridworld) : layout of the gridworld, see Grid.Gridworld
+            n_agents (int > 0) : amount of agents
+            n (int > 0) : amounts of steps, np.inf (Monte Carlo) is not possible here
+            epsilon (0<= float <= 1) : for the epsilon-greedy policy
+            decreasing_epsilon (bool) : if true decreasing epsilon after each episode
+            gamma (0<= float <= 1) : discount for future rewards
+            alpha (0<= float <= 1) : stepsize (learning rate)
+            rng (numpy.random.Generator, int or None) : generator or seed for everything random, None for a random seed
+        """
+
+        if n == np.inf:
+            raise ValueError("BatchSARSAn needs a finite n, use SARSAn for Monte Carlo")
+
+        self.n_agents = n_agents
+        self.n = int(n)
+        self.epsilon = np.full(n_agents, float(epsilon))
+        self.decreasing_epsilon = decreasing_epsilon
+        self.gamma = gamma
+        self.alpha = alpha
+        self.random = np.random.default_rng(rng)
+        self.environments = BatchGrid.BatchGridworld(gridworld, n_envs=n_agents, rng=self.random.integers(2**63))
+        self.powers = gamma ** np.arange(self.n + 1)
+
+        # initialize policy q : B * len(action) * y * x, terminal state 0
+        environments = self.environments
+        self.q = self.random.normal(size=(n_agents, len(environments.getActions()), environments.getYdim(), environments.getXdim()), scale=0.2)
+        terminal = environments.getTerminal()
+        self.q[:,:,terminal[0],terminal[1]] = 0
+
+        # ring buffers of the last n+2 steps of each agent, like Buffers.TrajectoryBuffer
+        self.capacity = self.n + 2
+        self.states = np.zeros(shape=(n_agents,self.capacity),dtype=int)
+        self.actions = np.zeros(shape=(n_agents,self.capacity),dtype=int)
+        self.rewards = np.zeros(shape=(n_agents,self.capacity))
+
+    def flatQ(self):
+        """
+        view of q with the layout [agent, action, y*x_dim+x]
+        """
+        return self.q.reshape(self.n_agents, self.q.shape[1], -1)
+
+    def policy(self,agents,states):
+        """ epsilon-greedy actions of some agents
+
+        ### Arguments:
+            agents (np.array(dtype=int)) : indices of the agents
+            states (np.array(dtype=int)) : state index y*x_dim+x of each of these agents
+
+        ### return:
+            actions (np.array(dtype=int)) : index of the action of each agent
+        """
+        actions = np.argmax(self.flatQ()[agents,:,states], axis=1)
+        random_action = self.random.random(len(agents)) < self.epsilon[agents]
+        return np.where(random_action, self.random.integers(self.q.shape[1], size=len(agents)), actions)
+
+    def estimate(self,agents,tau,terminal_index):
+        """ n-step return of step tau for some agents, same estimate as SARSAn.episode
+
+        ### Arguments:
+            agents (np.array(dtype=int)) : indices of the agents
+            tau (np.array(dtype=int)) : step to update of each agent
+            terminal_index (np.array(dtype=int)) : T of each agent, larger than tau+n if not known yet
+
+        ### return:
+            estimate (np.array) : discounted rewards tau until min(tau+n, T) and the estimate after n steps if before T
+        """
+        n = self.n
+        capacity = self.capacity
+
+        index = (tau[:,None] + np.arange(n)) % capacity
+        known = tau[:,None] + np.arange(n) < terminal_index[:,None]
+        estimate = np.where(known, self.rewards[agents[:,None], index], 0.0) @ self.powers[:n]
+
+        # estimate after n steps if we are not yet at the terminal state
+        future = (tau + n) % capacity
+        bootstrap = tau + n < terminal_index
+        estimate += np.where(bootstrap, self.powers[n] * self.flatQ()[agents, self.actions[agents,future], self.states[agents,future]], 0.0)
+        return estimate
+
+    def update(self,agents,tau,estimate):
+        """ moves q of the state and action of step tau of some agents towards the estimate
+        """
+        q = self.flatQ()
+        update = tau % self.capacity
+        actions = self.actions[agents,update]
+        states = self.states[agents,update]
+        q[agents, actions, states] += self.alpha * (estimate - q[agents, actions, states])
+
+    def start(self,episodes = 10):
+        ''' Every agent does episodes amount of episodes
+
+        ### Arguments:
+            episodes (int >=1 ) = the amount of episodes of each agent
+
+        ### return:
+            average_return (np.array(shape(B, episodes))) = average return per step of each episode of each agent
+            returns (np.array(shape(B, episodes))) = total return of each episode of each agent
+            steps (np.array(shape(B, episodes))) = amount of steps of each episode of each agent
+        '''
+
+        B = self.n_agents
+        n = self.n
+        capacity = self.capacity
+        environments = self.environments
+        all_agents = np.arange(B)
+        never = np.full(B, np.iinfo(np.int64).max)
+
+        returns = np.zeros(shape=(B,episodes))
+        steps = np.zeros(shape=(B,episodes),dtype=int)
+
+        episode = np.zeros(B,dtype=int) # episodes done by each agent
+        t = np.zeros(B,dtype=int) # step of each agent in its episode
+        episode_return = np.zeros(B)
+
+        # first state and action of every agent
+        environments.reset()
+        self.states[:,0] = environments.agents
+        self.actions[:,0] = self.policy(all_agents, environments.agents)
+
+        active = np.ones(B,dtype=bool)
+        while active.any():
+
+            # make step and observe new state and reward for all agents
+            s, r, at_terminal = environments.step(self.actions[all_agents, t % capacity])
+            s = s[:,0] * environments.getXdim() + s[:,1]
+            episode_return += r
+
+            # selection next action and remember state, action and reward for later policy updates
+            self.states[all_agents, (t+1) % capacity] = s
+            self.actions[all_agents, (t+1) % capacity] = self.policy(all_agents, s)
+            self.rewards[all_agents, t % capacity] = r
+
+            # one update n steps behind
+            agents = np.flatnonzero(active & ~at_terminal & (t >= n))
+            tau = t[agents] - n
+            self.update(agents, tau, self.estimate(agents, tau, never[agents]))
+
+            # at the terminal state all remaining updates in order
+            finished = np.flatnonzero(active & at_terminal)
+            if len(finished) > 0:
+                terminal_index = t[finished] + 1
+                first = np.maximum(terminal_index - 1 - n, 0)
+
+                # only the first of them can look at q after n steps, so all estimates can be calculated
+                # before the updates, but the updates are done in order, a state-action can come twice
+                tau = first[:,None] + np.arange(n + 1)
+                todo = tau < terminal_index[:,None]
+                rows = np.broadcast_to(finished[:,None], tau.shape)
+                estimate = np.zeros(tau.shape)
+                estimate[todo] = self.estimate(rows[todo], tau[todo], np.broadcast_to(terminal_index[:,None], tau.shape)[todo])
+                for k in range(n + 1):
+                    self.update(finished[todo[:,k]], tau[todo[:,k],k], estimate[todo[:,k],k])
+
+                returns[finished, episode[finished]] = episode_return[finished]
+                steps[finished, episode[finished]] = terminal_index
+                episode[finished] += 1
+
+                # calculate new epsilon, should be 0 at the end
+                if self.decreasing_epsilon:
+                    self.epsilon[finished] -= self.epsilon[finished] / episodes
+
+                # next episode, the gridworld is already back at the start
+                active[finished] = episode[finished] < episodes
+                t[finished] = 0
+                episode_return[finished] = 0
+                self.states[finished,0] = environments.agents[finished]
+                self.actions[finished,0] = self.policy(finished, environments.agents[finished])
+
+            t[~at_terminal] += 1
+
+        return returns / steps, returns, steps
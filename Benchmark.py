@@ -0,0 +1,212 @@
+'''
+    File name: Benchmark.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import numpy as np
+import Grid
+import GridGenerator
+import Gridworlds
+import Kernel
+import SARSAn
+
+def timeit(function, repeat):
+    """
+    runs function repeat times and returns the fastest wall time in seconds
+    """
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmarkStep(gridworld, steps, repeat):
+    """
+    Gridworld.step calls per second
+    """
+    world = Grid.Gridworld(gridworld, rng=0)
+    actions = np.random.default_rng(0).integers(len(world.getActions()), size=steps).tolist()
+
+    def run():
+        world.reset()
+        for action in actions:
+            world.step(action)
+            if world.inTerminal():
+                world.reset()
+
+    return steps / timeit(run, repeat)
+
+def benchmarkPolicy(gridworld, calls, repeat):
+    """
+    SARSAn.policy calls per second
+    """
+    world = Grid.Gridworld(gridworld, rng=0)
+    player = SARSAn.SARSAn(world, headless=True, rng=0)
+    states = [[y,x] for y in range(world.getYdim()) for x in range(world.getXdim())]
+    states = (states * (calls // len(states) + 1))[:calls]
+
+    def run():
+        for state in states:
+            player.policy(state)
+
+    return calls / timeit(run, repeat)
+
+def benchmarkEpisode(gridworld, n, episodes, repeat, compiled = False):
+    """
+    mean wall time of one SARSAn.episode in seconds, always starting from the same agent
+    (the gridworld and the agent are created before the time is measured)
+    """
+    def create():
+        world = Grid.Gridworld(gridworld, rng=0)
+        return SARSAn.SARSAn(world, n=n, headless=True, rng=0, compiled=compiled)
+
+    # the first compiled episode also compiles the kernel
+    if compiled:
+        create().episode()
+
+    best = np.inf
+    for _ in range(repeat):
+        player = create()
+        start = time.perf_counter()
+        for _ in range(episodes):
+            player.episode()
+        best = min(best, time.perf_counter() - start)
+    return best / episodes
+
+def benchmarkInit(gridworld, repeat):
+    """
+    wall time of the Gridworld constructor in seconds
+    """
+    return timeit(lambda: Grid.Gridworld(gridworld, rng=0), repeat)
+
+def benchmarkStart(gridworld, episodes, repeat, compiled = False, flat_states = False):
+    """
+    environment steps per second of a whole SARSAn.start run
+    """
+    steps = []
+
+    def run():
+        world = Grid.Gridworld(gridworld, rng=0, flat_states=flat_states)
+        player = SARSAn.SARSAn(world, n=10, decreasing_epsilon=True, headless=True, rng=0, compiled=compiled)
+        steps.append(player.start(episodes=episodes, evaluation=False)[2].sum())
+
+    # the same seeds give the same amount of steps in every run, the first one also compiles the kernel
+    run()
+    return steps[0] / timeit(run, repeat)
+
+def benchmarkImport(code, repeat):
+    """
+    wall time in seconds of a new python process running code (e.g. "import SARSAn"), without the
+    time of a new python process doing nothing, so the startup of a training entry point is measured
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    run = lambda command: subprocess.run([sys.executable, "-c", command], cwd=directory, check=True)
+    return max(timeit(lambda: run(code), repeat) - timeit(lambda: run("pass"), repeat), 0.0)
+
+def runBenchmarks(quick = False, repeat = 3):
+    """
+    runs all benchmarks
+
+    ### Arguments:
+        quick (bool) : less steps and episodes, for a fast check
+        repeat (int > 0) : the fastest of repeat runs counts
+
+    ### return:
+        results (dict) : name of each benchmark : {"value", "unit", "higher_is_better"}
+    """
+
+    scale = 0.1 if quick else 1.0
+    results = {}
+
+    def add(name, value, unit, higher_is_better):
+        results[name] = {"value" : float(value), "unit" : unit, "higher_is_better" : higher_is_better}
+
+    layouts = [("gridworld" + str(i), gridworld) for i, gridworld in enumerate(Gridworlds.Gridworlds.GRIDWORLD)]
+    large_layouts = [("generated" + str(size), GridGenerator.generateGridworld(size, size, seed=0)) for size in (20, 50)]
+
+    for module in ("Grid", "SARSAn", "Train"):
+        add("import/" + module, benchmarkImport("import " + module, repeat), "s", False)
+
+    add("init/generated1000", benchmarkInit(GridGenerator.generateGridworld(1000, 1000, seed=0), repeat), "s", False)
+
+    for name, gridworld in layouts + large_layouts:
+        add("step/" + name, benchmarkStep(gridworld, int(100000 * scale), repeat), "steps/s", True)
+
+    add("policy/gridworld0", benchmarkPolicy(Gridworlds.Gridworlds.GRIDWORLD0, int(100000 * scale), repeat), "calls/s", True)
+
+    for n in (1, 10, np.inf):
+        add("episode/gridworld0/n=" + str(n), benchmarkEpisode(Gridworlds.Gridworlds.GRIDWORLD0, n, max(1, int(50 * scale)), repeat), "s", False)
+
+    for name, gridworld in layouts + large_layouts:
+        episodes = max(1, int(50 * scale))
+        add("start/" + name, benchmarkStart(gridworld, episodes, repeat), "steps/s", True)
+        add("start/" + name + "/flat", benchmarkStart(gridworld, episodes, repeat, flat_states=True), "steps/s", True)
+        add("start/" + name + "/compiled", benchmarkStart(gridworld, episodes, repeat, compiled=True), "steps/s", True)
+
+    return results
+
+def compare(results, baseline, tolerance):
+    """
+    compares the results with a baseline
+
+    ### Arguments:
+        results, baseline (dict) : results of runBenchmarks
+        tolerance (float >= 0) : allowed relative slowdown
+
+    ### return:
+        regressions (list) : (name, value, baseline value, relative change) of all benchmarks slower than the tolerance
+    """
+
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]["value"]
+        new = result["value"]
+        # relative change, positive means faster
+        change = (new - old) / old if result["higher_is_better"] else (old - new) / old
+        if change < -tolerance:
+            regressions.append((name, new, old, change))
+    return regressions
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description = "throughput benchmarks of Gridworld and SARSAn")
+    parser.add_argument("--output", default = None, help = "write the results as json to this file")
+    parser.add_argument("--baseline", default = None, help = "json file of an earlier run to compare with")
+    parser.add_argument("--tolerance", type = float, default = 0.2, help = "allowed relative slowdown against the baseline")
+    parser.add_argument("--repeat", type = int, default = 3)
+    parser.add_argument("--quick", action = "store_true")
+    args = parser.parse_args()
+
+    report = {
+        "meta" : {"python" : platform.python_version(), "numpy" : np.__version__, "numba" : Kernel.NUMBA_AVAILABLE,
+                  "machine" : platform.machine(), "time" : time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "results" : runBenchmarks(quick = args.quick, repeat = args.repeat),
+    }
+
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent = 2)
+    else:
+        json.dump(report, sys.stdout, indent = 2)
+        print("")
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(report["results"], baseline, args.tolerance)
+        for name, new, old, change in regressions:
+            print("REGRESSION", name, ":", new, "instead of", old, "(" + format(change, "+.1%") + ")", file = sys.stderr)
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,321 @@
+'''
+    File name: Buffers.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+
+class DiscountedReturn:
+    """
+    Rolling n-step discounted return for the n-step SARSA updates
+
+    For the update of step tau the return is
+        sum(gamma**(i-tau) * reward[i] for i in range(tau, min(tau+n, T)))
+    Rewards are kept in a ring buffer. The rewards are split in blocks of n steps: for the current block
+    the discounted sums until its end are calculated once backwards, for the rewards after it the
+    discounted sums from its end are added up while they come in. Each return is then one of each
+    combined with a precomputed power of gamma, so each update costs constant time (amortized)
+    and nothing has to be subtracted or divided.
+    For n = np.inf (Monte Carlo) all returns are calculated backwards once the terminal state is found.
+
+    ### Attributes:
+        gamma (0<= float <= 1) : discount for future rewards
+        n (int > 0 or np.inf) : amount of steps
+        powers (np.array(shape(n+1))) : gamma**k for k in 0..n (only for finite n)
+        rewards (np.array) : ring buffer of the rewards
+        sums (np.array) : discounted sums belonging to the rewards in the ring buffer
+    """
+
+    def __init__(self,gamma,n,capacity = 64):
+        """
+        ### Arguments:
+            gamma (0<= float <= 1) : discount for future rewards
+            n (int > 0 or np.inf) : amount of steps
+            capacity (int > 0) : initial size of the ring buffer for n = np.inf, it grows if needed
+        """
+
+        self.gamma = gamma
+        self.n = n
+        self.finite = n != np.inf
+
+        if self.finite:
+            self.n = int(n)
+            self.powers = gamma ** np.arange(self.n + 1)
+            # at most the rewards of two blocks are needed at the same time
+            capacity = 2 * self.n + 2
+
+        self.rewards = np.zeros(capacity)
+        self.sums = np.zeros(capacity)
+        self.reset()
+
+    def reset(self):
+        """
+        empties the buffer for a new episode
+        """
+        self.first = 0 # tau, the step of the next return
+        self.count = 0 # amount of rewards in this episode
+        self.block_end = 0 # first step after the current block
+        self.terminal_index = None # T, if we found it
+
+    def append(self,reward):
+        """
+        adds the reward of the next step
+        """
+
+        if self.count - self.first == len(self.rewards):
+            self.grow()
+
+        i = self.count
+        size = len(self.rewards)
+        self.rewards[i % size] = reward
+
+        # discounted sum from the end of the current block until this reward
+        if self.finite and i >= self.block_end:
+            before = self.sums[(i-1) % size] if i > self.block_end else 0.0
+            self.sums[i % size] = before + self.power(i - self.block_end) * reward
+
+        self.count += 1
+
+    def finish(self):
+        """
+        marks that the last appended reward led to the terminal state
+        """
+        self.terminal_index = self.count
+
+    def pop(self):
+        """
+        returns the discounted return of the oldest step that is not returned yet
+
+        ### return:
+            estimate (float) : sum(gamma**(i-tau) * reward[i] for i in range(tau, min(tau+n, T)))
+        """
+
+        tau = self.first
+        size = len(self.rewards)
+
+        if self.finite and tau + self.n <= self.count:
+            # all n rewards are known, combine the sums of the block with the ones after it
+            if tau == self.block_end:
+                self.newBlock(tau + self.n)
+            end = tau + self.n
+            after = self.sums[(end-1) % size] if end > self.block_end else 0.0
+            estimate = self.sums[tau % size] + self.powers[self.block_end - tau] * after
+
+        elif self.terminal_index is not None:
+            # the terminal state is less than n steps away
+            if self.block_end != self.terminal_index:
+                self.newBlock(self.terminal_index)
+            estimate = self.sums[tau % size]
+
+        else:
+            raise ValueError("the return of step " + str(tau) + " needs rewards that are not known yet")
+
+        self.first += 1
+        return estimate
+
+    def newBlock(self,block_end):
+        """
+        calculates the discounted sums from every not returned reward until block_end backwards
+        and the sums from block_end until every reward after it forwards
+        """
+
+        size = len(self.rewards)
+
+        running = 0.0
+        for i in range(block_end - 1, self.first - 1, -1):
+            running = self.rewards[i % size] + self.gamma * running
+            self.sums[i % size] = running
+
+        self.block_end = block_end
+        running = 0.0
+        for i in range(block_end, self.count):
+            running += self.power(i - block_end) * self.rewards[i % size]
+            self.sums[i % size] = running
+
+    def power(self,k):
+        """
+        gamma**k, from the table if possible
+        """
+        if self.finite and k <= self.n:
+            return self.powers[k]
+        return self.gamma ** k
+
+    def grow(self):
+        """
+        doubles the size of the ring buffer and keeps all not returned rewards
+        """
+        old_size = len(self.rewards)
+        index = np.arange(self.first, self.count)
+
+        rewards = np.zeros(2 * old_size)
+        sums = np.zeros(2 * old_size)
+        rewards[index % len(rewards)] = self.rewards[index % old_size]
+        sums[index % len(sums)] = self.sums[index % old_size]
+
+        self.rewards = rewards
+        self.sums = sums
+
+class TrajectoryBuffer:
+    """
+    States and actions of the current episode for the n-step SARSA updates
+
+    Allocated once and reused in every episode. For finite n it is a ring buffer, because the
+    update of step tau only needs the steps tau until tau+n, and the newest step t+1 is already
+    stored when tau = t-n is updated, so n+2 entries are enough.
+    For n = np.inf (Monte Carlo) the whole episode is kept and the buffer doubles its size when it is full.
+
+    ### Attributes:
+        states (np.array(shape(size,2),dtype=int)) : [y,x] states, np.array(shape(size),dtype=int) of indices with flat states
+        actions (np.array(shape(size),dtype=int)) : indices of the actions taken in the states
+        count (int) : amount of steps stored in this episode
+    """
+
+    def __init__(self,n,capacity = 64,flat = False):
+        """
+        ### Arguments:
+            n (int > 0 or np.inf) : amount of steps
+            capacity (int > 0) : initial size for n = np.inf, it grows if needed
+            flat (bool) : if the states are indices y*x_dim+x (Grid.Gridworld with flat_states) instead of [y,x]
+        """
+
+        self.ring = n != np.inf
+        if self.ring:
+            capacity = int(n) + 2
+
+        self.states = np.zeros(shape=(capacity,) if flat else (capacity,2),dtype=int)
+        self.actions = np.zeros(shape=(capacity),dtype=int)
+        self.reset()
+
+    def reset(self):
+        """
+        empties the buffer for a new episode
+        """
+        self.count = 0
+
+    def append(self,state,action):
+        """
+        stores the state of the next step and the action taken there
+        """
+
+        if not self.ring and self.count == len(self.actions):
+            self.grow()
+
+        i = self.count % len(self.actions)
+        self.states[i] = state
+        self.actions[i] = action
+        self.count += 1
+
+    def getState(self,t):
+        return self.states[t % len(self.actions)] # [y,x] or index
+
+    def getAction(self,t):
+        return self.actions[t % len(self.actions)]
+
+    def grow(self):
+        """
+        doubles the size of the buffer (only used without ring buffer)
+        """
+        self.states = np.concatenate([self.states, np.zeros_like(self.states)])
+        self.actions = np.concatenate([self.actions, np.zeros_like(self.actions)])
+
+class TraceSet:
+    """
+    Sparse eligibility traces for SARSA(lambda)
+
+    Only the state-action pairs with a trace of at least cutoff are kept, in arrays that are compacted
+    when traces fall below it, so an update costs time proportional to the amount of active traces
+    and not to the size of the gridworld. slots maps every state-action to its place in the arrays.
+
+    ### Attributes:
+        actions, ys, xs (np.array(dtype=int)) : action and [y,x] state of each active trace
+        values (np.array) : the traces
+        count (int) : amount of active traces
+        slots (np.array(shape(len(action) , y , x),dtype=int)) : place of the trace of each state-action, -1 if not active
+    """
+
+    def __init__(self,shape,capacity = 64):
+        """
+        ### Arguments:
+            shape (tuple) : (len(action) , y , x), the shape of the q-values
+            capacity (int > 0) : initial size of the arrays, they grow if needed
+        """
+
+        self.slots = np.full(shape, -1, dtype=int)
+        self.actions = np.zeros(capacity, dtype=int)
+        self.ys = np.zeros(capacity, dtype=int)
+        self.xs = np.zeros(capacity, dtype=int)
+        self.values = np.zeros(capacity)
+        self.count = 0
+
+    def reset(self):
+        """
+        removes all traces for a new episode
+        """
+        c = self.count
+        self.slots[self.actions[:c], self.ys[:c], self.xs[:c]] = -1
+        self.count = 0
+
+    def visit(self,action,state,replacing = False):
+        """
+        increases the trace of the action in state [y,x] by 1 (accumulating) or sets it to 1 (replacing)
+        """
+
+        slot = self.slots[action, state[0], state[1]]
+        if slot >= 0:
+            self.values[slot] = 1.0 if replacing else self.values[slot] + 1.0
+            return
+
+        if self.count == len(self.values):
+            self.grow()
+
+        slot = self.count
+        self.actions[slot] = action
+        self.ys[slot] = state[0]
+        self.xs[slot] = state[1]
+        self.values[slot] = 1.0
+        self.slots[action, state[0], state[1]] = slot
+        self.count += 1
+
+    def active(self):
+        """
+        ### return:
+            actions, ys, xs, values (np.array) : views of the active traces, each state-action once
+        """
+        c = self.count
+        return self.actions[:c], self.ys[:c], self.xs[:c], self.values[:c]
+
+    def decay(self,factor,cutoff):
+        """
+        multiplies all traces by factor (gamma * lambda) and removes the ones below cutoff
+        """
+
+        c = self.count
+        values = self.values[:c]
+        values *= factor
+
+        keep = values >= cutoff
+        if keep.all():
+            return
+
+        actions, ys, xs = self.actions[:c], self.ys[:c], self.xs[:c]
+        self.slots[actions[~keep], ys[~keep], xs[~keep]] = -1
+
+        c = int(keep.sum())
+        self.actions[:c] = actions[keep]
+        self.ys[:c] = ys[keep]
+        self.xs[:c] = xs[keep]
+        self.values[:c] = values[keep]
+        self.slots[self.actions[:c], self.ys[:c], self.xs[:c]] = np.arange(c)
+        self.count = c
+
+    def grow(self):
+        """
+        doubles the size of the arrays
+        """
+        self.actions = np.concatenate([self.actions, np.zeros_like(self.actions)])
+        self.ys = np.concatenate([self.ys, np.zeros_like(self.ys)])
+        self.xs = np.concatenate([self.xs, np.zeros_like(self.xs)])
+        self.values = np.concatenate([self.values, np.zeros_like(self.values)])
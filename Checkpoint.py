@@ -0,0 +1,76 @@
+'''
+    File name: Checkpoint.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import os
+import numpy as np
+
+# files in the checkpoint directory
+Q_FILE = "q.npy"
+STATE_FILE = "state.npz"
+
+def save(path, q, epsilon, episode, average_return, returns, steps):
+    """
+    saves the state of a SARSAn agent in the directory path
+
+    The q-values are saved as .npy file, so they can be memory-mapped by loadQ. The files are first
+    written under a temporary name and then renamed, so a crash never leaves a half written checkpoint.
+
+    ### Arguments:
+        path (str) : directory of the checkpoint, created if it does not exist
+        q (np.array(shape(len(action) , y , x))) : the q-values
+        epsilon (float) : current epsilon of the policy (after the decrease)
+        episode (int) : amount of episodes done
+        average_return, returns, steps (np.array) : statistics of the episodes done
+    """
+
+    os.makedirs(path, exist_ok=True)
+
+    q_file = os.path.join(path, Q_FILE)
+    with open(q_file + ".tmp", "wb") as file:
+        np.save(file, np.ascontiguousarray(q))
+    os.replace(q_file + ".tmp", q_file)
+
+    # the state is written last, it marks the checkpoint as complete
+    state_file = os.path.join(path, STATE_FILE)
+    with open(state_file + ".tmp", "wb") as file:
+        np.savez(file, epsilon=epsilon, episode=episode, average_return=average_return[:episode],
+                 returns=returns[:episode], steps=steps[:episode])
+    os.replace(state_file + ".tmp", state_file)
+
+def exists(path):
+    """
+    checks whether there is a complete checkpoint in the directory path
+    """
+    return os.path.isfile(os.path.join(path, STATE_FILE)) and os.path.isfile(os.path.join(path, Q_FILE))
+
+def loadQ(path, mmap = True):
+    """
+    loads the q-values of a checkpoint
+
+    ### Arguments:
+        path (str) : directory of the checkpoint
+        mmap (bool) : if true the q-values are memory-mapped read-only, so many processes can share them without a copy
+
+    ### return:
+        q (np.array(shape(len(action) , y , x))) : the q-values
+    """
+    return np.load(os.path.join(path, Q_FILE), mmap_mode="r" if mmap else None)
+
+def load(path):
+    """
+    loads a checkpoint to continue learning
+
+    ### return:
+        checkpoint (dict) : with the keys q (in memory), epsilon, episode, average_return, returns and steps
+    """
+    with np.load(os.path.join(path, STATE_FILE)) as state:
+        checkpoint = {key : state[key] for key in state.files}
+    checkpoint["epsilon"] = float(checkpoint["epsilon"])
+    checkpoint["episode"] = int(checkpoint["episode"])
+    checkpoint["q"] = loadQ(path, mmap=False)
+    return checkpoint
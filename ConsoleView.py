@@ -0,0 +1,140 @@
+'''
+    File name: ConsoleView.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import sys
+import time
+import numpy as np
+
+# ANSI escape codes
+CLEAR = "\x1b[2J\x1b[H"
+CLEAR_LINE = "\x1b[K"
+
+def moveTo(row,column):
+    """
+    ANSI code to move the cursor to row and column (both start at 1)
+    """
+    return "\x1b[" + str(row) + ";" + str(column) + "H"
+
+class ConsoleRenderer:
+    """
+    Draws a gridworld in the console and afterwards only moves the agent
+
+    The first frame clears the console and prints the whole board (same layout as before).
+    Every later frame overwrites only the field the agent left and the field it is on with ANSI
+    cursor codes, and the status line below the board. Each frame is one write to the stream.
+    With max_fps frames that come too early are skipped, the next frame still shows the right state.
+    The whole board has to fit into the console, otherwise it scrolls and the positions are wrong.
+
+    ### Attributes:
+        world (np.array(shape(y,x))) : values for all states being rewards and np.NaN for barriers
+        stream (file) : where to write, None for sys.stdout at the time of drawing
+        max_fps (float > 0 or None) : at most this many frames per second, None for no limit
+        shown (list or None) : [y,x] of the agent on the screen, None if the board has to be printed again
+    """
+
+    def __init__(self,world,stream = None,max_fps = None):
+        """
+        ### Arguments:
+            world (np.array(shape(y,x))) : Gridworld.world
+            stream (file) : where to write, None for sys.stdout
+            max_fps (float > 0 or None) : at most this many frames per second, None for no limit
+        """
+        self.world = world
+        self.stream = stream
+        self.max_fps = max_fps
+        self.shown = None
+        self.last_frame = -np.inf
+        self.status_row = 3 * world.shape[0] + 7
+
+    def board(self):
+        """
+        the whole board without agent as string
+        """
+        y_dim, x_dim = self.world.shape
+        lines = [""]
+
+        for y in range(y_dim):
+
+            # left side y values
+            firstLine = "    ||"
+            thisLine = ("      " + str(y) + " ||")[-6:]
+            nextLine =  "____||"
+
+            for x in range(x_dim):
+                val = self.world[y,x]
+
+                if np.isnan(val): # if it is a barrier
+                    firstLine += "XXXXX|"
+                    thisLine += "XXXXX|"
+                    nextLine += "XXXXX|"
+                elif val == 0.0:
+                    firstLine += "     |"
+                    thisLine += "     |"
+                    nextLine += "_____|"
+                else: # if it has a reward
+                    firstLine += "     |"
+                    thisLine += ("     " + str(int(val)))[-5:] + "|"
+                    nextLine += "_____|"
+
+            lines += [firstLine, thisLine, nextLine]
+
+        # at the bottom of the print, pritn x coordinates
+        topLine = "____||" + "_____|" * x_dim
+        line = "    ||" + "     |" * x_dim
+        middleLine = "    ||" + "".join(("      " + str(x) + " |")[-6:] for x in range(x_dim))
+        lines += [topLine, line, middleLine, line, ""]
+
+        return "\n".join(lines) + "\n"
+
+    def field(self,state,text):
+        """
+        ANSI code to write text into the bottom line of the field of state [y,x]
+        """
+        return moveTo(3 * state[0] + 4, 6 * state[1] + 7) + text
+
+    def draw(self,agent,status = None,force = False):
+        """
+        shows the agent at [y,x] and the status line (e.g. the episode) below the board
+
+        ### Arguments:
+            agent [y,x] : state of the agent
+            status (str) : written below the board, None for an empty line
+            force (bool) : draw even if max_fps does not allow it yet
+
+        ### return:
+            drawn (bool) : if the frame was drawn
+        """
+
+        now = time.perf_counter()
+        if not force and self.max_fps is not None and now - self.last_frame < 1.0 / self.max_fps:
+            return False
+        self.last_frame = now
+
+        agent = [int(agent[0]), int(agent[1])]
+        frame = []
+        if self.shown is None:
+            frame.append(CLEAR + self.board())
+        elif self.shown != agent:
+            frame.append(self.field(self.shown, "_____"))
+        if self.shown != agent:
+            frame.append(self.field(agent, "__A__"))
+        self.shown = agent
+
+        # leave the cursor below the board, so other prints go there
+        frame.append(moveTo(self.status_row, 1) + CLEAR_LINE + ("" if status is None else str(status)) + "\n")
+
+        stream = sys.stdout if self.stream is None else self.stream
+        stream.write("".join(frame))
+        stream.flush()
+        return True
+
+    def redraw(self):
+        """
+        prints the whole board again in the next frame, e.g. if something else was printed over it
+        """
+        self.shown = None
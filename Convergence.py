@@ -0,0 +1,144 @@
+'''
+    File name: Convergence.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import collections
+import numpy as np
+import Evaluation
+
+class ConvergenceMonitor:
+    """
+    Decides when the training can stop because the agent does not learn anything new any more
+
+    After each episode update gets the q-values and the return of the episode and checks
+        the greedy policy : at most max_policy_changes states have a different best action than after the last episode
+        max |delta q| : no q-value changed more than q_tolerance in this episode
+        moving average return : the mean return of the last return_window episodes changed at most return_tolerance
+    If all of them hold in patience episodes after each other the training converged. A criterion with
+    tolerance None is not checked. The gridworld moves randomly sometimes, so q never stops changing
+    completely, q_tolerance has to be larger than one update after such a random move.
+    The monitor only stops the learning, it does not change the exploration: with decreasing_epsilon the
+    schedule of SARSAn goes over all episodes of start, so after an early stop epsilon is still larger than
+    planned. Give SARSAn epsilon_decay_episodes to make the schedule independent of the amount of episodes.
+
+        monitor = Convergence.ConvergenceMonitor(patience = 10)
+        player.start(episodes = 500, monitor = monitor)
+        print(monitor.reason)
+
+    ### Attributes:
+        patience (int > 0) : amount of stable episodes after each other before it converged
+        max_policy_changes (int >= 0 or None) : states with a new best action that still count as stable
+        q_tolerance (float >= 0 or None) : largest change of a q-value in an episode that still counts as stable
+        return_window (int > 0) : amount of episodes in the moving average of the returns
+        return_tolerance (float >= 0 or None) : largest change of the moving average that still counts as stable
+        stable (int) : amount of stable episodes since the last unstable one
+        episodes (int) : amount of episodes seen since the last reset
+        policy_changes (int) : states with a new best action in the last episode
+        max_delta_q (float) : largest change of a q-value in the last episode
+        average_return (float) : moving average of the returns, np.nan until return_window episodes are done
+        converged (bool) : if the training converged
+        reason (str) : why it converged, None if it did not
+    """
+
+    def __init__(self,patience = 10,max_policy_changes = 0,q_tolerance = 2.0,return_window = 20,return_tolerance = 0.5):
+        """
+        ### Arguments:
+            patience (int > 0) : amount of stable episodes after each other before it converged
+            max_policy_changes (int >= 0 or None) : states with a new best action that still count as stable, None to ignore the policy
+            q_tolerance (float >= 0 or None) : largest change of a q-value in an episode that still counts as stable, None to ignore it
+            return_window (int > 0) : amount of episodes in the moving average of the returns
+            return_tolerance (float >= 0 or None) : largest change of the moving average that still counts as stable, None to ignore it
+        """
+
+        if patience < 1 or return_window < 1:
+            raise ValueError("patience and return_window have to be at least 1")
+
+        self.patience = patience
+        self.max_policy_changes = max_policy_changes
+        self.q_tolerance = q_tolerance
+        self.return_window = return_window
+        self.return_tolerance = return_tolerance
+        self.reset()
+
+    def reset(self):
+        """
+        forgets everything, e.g. for a new training
+        """
+        self.previous_q = None
+        self.previous_policy = None
+        self.returns = collections.deque(maxlen=self.return_window)
+        self.stable = 0
+        self.episodes = 0
+        self.policy_changes = 0
+        self.max_delta_q = np.nan
+        self.average_return = np.nan
+        self.converged = False
+        self.reason = None
+
+    def update(self,q,episode_return):
+        """
+        checks the criteria after one episode
+
+        ### Arguments:
+            q (np.array(shape(len(action) , y , x))) : the q-values after the episode, e.g. SARSAn.getQ()
+            episode_return (float) : total return of the episode
+
+        ### return:
+            converged (bool) : if the criteria held in the last patience episodes
+        """
+
+        policy = Evaluation.greedyPolicy(q)
+        self.returns.append(episode_return)
+        previous_average = self.average_return
+        if len(self.returns) == self.return_window:
+            self.average_return = sum(self.returns) / self.return_window
+
+        if self.previous_q is None:
+            # nothing to compare with after the first episode
+            self.previous_q = np.array(q)
+            self.previous_policy = policy
+            self.episodes += 1
+            return self.converged
+
+        self.policy_changes = int(np.count_nonzero(policy != self.previous_policy))
+        self.max_delta_q = float(np.nanmax(np.abs(q - self.previous_q)))
+        np.copyto(self.previous_q, q)
+        self.previous_policy = policy
+        self.episodes += 1
+
+        stable = True
+        if self.max_policy_changes is not None:
+            stable &= self.policy_changes <= self.max_policy_changes
+        if self.q_tolerance is not None:
+            stable &= self.max_delta_q <= self.q_tolerance
+        if self.return_tolerance is not None:
+            # the moving average needs return_window episodes, and one more to compare it with
+            stable &= not np.isnan(previous_average) and abs(self.average_return - previous_average) <= self.return_tolerance
+
+        self.stable = self.stable + 1 if stable else 0
+        if self.stable >= self.patience and not self.converged:
+            self.converged = True
+            self.reason = self.describe()
+        return self.converged
+
+    def describe(self):
+        """
+        ### return:
+            reason (str) : the criteria that held in the last stable episodes
+        """
+        criteria = []
+        if self.max_policy_changes is not None:
+            if self.max_policy_changes == 0:
+                criteria.append("greedy policy unchanged")
+            else:
+                criteria.append("greedy policy changed in at most " + str(self.max_policy_changes) + " states")
+        if self.q_tolerance is not None:
+            criteria.append("max |delta q| <= " + str(self.q_tolerance))
+        if self.return_tolerance is not None:
+            criteria.append("moving average return of " + str(self.return_window) + " episodes changed at most " + str(self.return_tolerance)
+                            + " (now " + format(self.average_return, ".2f") + ")")
+        return ", ".join(criteria) + " in each of the last " + str(self.stable) + " of " + str(self.episodes) + " episodes"
@@ -0,0 +1,134 @@
+'''
+    File name: DynamicProgramming.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+import Grid
+
+def model(gridworld):
+    """
+    the transition and reward tables of a Gridworld and the states without own values
+
+    ### Arguments:
+        gridworld (dict or Grid.Gridworld) : the environment
+
+    ### return:
+        world (Grid.Gridworld) : the environment as object
+        fixed (np.array(shape(y*x),dtype=bool)) : terminal state and barriers, their q-values stay 0
+    """
+    world = gridworld if isinstance(gridworld, Grid.Gridworld) else Grid.Gridworld(gridworld)
+    fixed = np.isnan(world.world).ravel()
+    fixed[world.toIndex(world.getTerminal())] = True
+    return world, fixed
+
+def backup(world, fixed, v, gamma):
+    """
+    expected q-values for the state values v under the state transition function of the gridworld:
+    with probability 1-epsilon the chosen action, with probability epsilon a random one of all actions
+
+    ### return:
+        q (np.array(shape(y*x, len(action)))) : q-values of all states and actions
+    """
+    # value of each action that is really done
+    done = world.reward + gamma * v[world.next_state]
+    q = (1 - world.epsilon) * done + world.epsilon * done.mean(axis=1, keepdims=True)
+    q[fixed] = 0.0
+    return q
+
+def toSARSAn(world, q):
+    """
+    converts q-values of shape (y*x, len(action)) to the shape (len(action), y, x) of SARSAn.q
+    """
+    return np.ascontiguousarray(q.T.reshape(q.shape[1], world.getYdim(), world.getXdim()))
+
+def valueIteration(gridworld, gamma = 0.99, theta = 1e-10, max_iterations = 100000):
+    """
+    optimal q-values of a gridworld with value iteration on its exact model
+
+    ### Arguments:
+        gridworld (dict or Grid.Gridworld) : the environment
+        gamma (0<= float < 1) : discount for future rewards
+        theta (float > 0) : stop when no state value changes more than theta
+        max_iterations (int > 0) : stop after max_iterations sweeps
+
+    ### return:
+        q (np.array(shape(len(action) , y , x))) : optimal q-values, like SARSAn.q
+    """
+
+    world, fixed = model(gridworld)
+    v = np.zeros(world.getNumStates())
+
+    for _ in range(max_iterations):
+        q = backup(world, fixed, v, gamma)
+        new_v = q.max(axis=1)
+        delta = np.abs(new_v - v).max()
+        v = new_v
+        if delta < theta:
+            break
+
+    return toSARSAn(world, backup(world, fixed, v, gamma))
+
+def policyIteration(gridworld, gamma = 0.99, theta = 1e-10, max_iterations = 100000, evaluation_sweeps = 50):
+    """
+    optimal q-values and policy of a gridworld with policy iteration on its exact model,
+    the policies are evaluated iteratively with all states at once, with at most evaluation_sweeps
+    sweeps before the next improvement (modified policy iteration)
+
+    ### Arguments:
+        gridworld (dict or Grid.Gridworld) : the environment
+        gamma (0<= float < 1) : discount for future rewards
+        theta (float > 0) : accuracy of the policy evaluation
+        max_iterations (int > 0) : maximal amount of policy improvements
+        evaluation_sweeps (int > 0) : maximal amount of sweeps of each policy evaluation
+
+    ### return:
+        q (np.array(shape(len(action) , y , x))) : optimal q-values, like SARSAn.q
+        policy (np.array(shape(y , x),dtype=int)) : optimal action of each state
+    """
+
+    world, fixed = model(gridworld)
+    states = np.arange(world.getNumStates())
+    v = np.zeros(world.getNumStates())
+    policy = np.zeros(world.getNumStates(), dtype=int)
+
+    for _ in range(max_iterations):
+
+        # evaluate the policy
+        for _ in range(evaluation_sweeps):
+            new_v = backup(world, fixed, v, gamma)[states, policy]
+            delta = np.abs(new_v - v).max()
+            v = new_v
+            if delta < theta:
+                break
+
+        # improve the policy, keep the old action if it is as good
+        q = backup(world, fixed, v, gamma)
+        best = q.argmax(axis=1)
+        stable = q[states, best] <= q[states, policy] + theta
+        if stable.all() and delta < theta:
+            break
+        policy = np.where(stable, policy, best)
+
+    return toSARSAn(world, q), policy.reshape(world.getYdim(), world.getXdim())
+
+def qError(q, q_optimal, gridworld):
+    """
+    how far learned q-values are from the optimal ones, only for states with own values (no terminal and no barriers)
+
+    ### Arguments:
+        q, q_optimal (np.array(shape(len(action) , y , x))) : learned and optimal q-values
+        gridworld (dict or Grid.Gridworld) : the environment
+
+    ### return:
+        error (dict) : max and mean absolute error of all q-values and the part of the states with the optimal greedy action
+    """
+    world, fixed = model(gridworld)
+    free = ~fixed.reshape(world.getYdim(), world.getXdim())
+    difference = np.abs(q - q_optimal)[:, free]
+    greedy_value = np.take_along_axis(q_optimal, np.argmax(q, axis=0)[None], axis=0)[0]
+    optimal_action = np.isclose(greedy_value, q_optimal.max(axis=0))[free]
+    return {"max" : float(difference.max()), "mean" : float(difference.mean()), "optimal_actions" : float(optimal_action.mean())}
@@ -0,0 +1,61 @@
+'''
+    File name: Evaluation.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+import BatchGrid
+
+def greedyPolicy(q):
+    """
+    greedy action of every state
+
+    ### Arguments:
+        q (np.array(shape(len(action) , y , x))) : the q-values
+
+    ### return:
+        policy (np.array(shape(y , x),dtype=int)) : index of the best action in each state
+    """
+    return np.argmax(q, axis=0)
+
+def evaluatePolicy(gridworld, policy, rollouts = 1000, max_steps = 1000, rng = None):
+    """
+    runs a fixed policy without learning in many copies of the gridworld at once (with BatchGrid.BatchGridworld)
+
+    ### Arguments:
+        gridworld (dict or Grid.Gridworld) : the environment
+        policy (np.array(shape(y , x),dtype=int)) : action for each state, e.g. from greedyPolicy
+        rollouts (int > 0) : amount of episodes
+        max_steps (int > 0) : episodes that did not reach the terminal state after max_steps steps are stopped
+        rng (numpy.random.Generator, int or None) : generator or seed for the state transition function
+
+    ### return:
+        results (dict) : mean_return, std_return, success_rate (part of the episodes that reached the terminal state),
+            mean_steps, steps_percentiles (50, 90 and 99 %) and returns, steps and success of each episode as np.array
+    """
+
+    environments = BatchGrid.BatchGridworld(gridworld, n_envs = rollouts, rng = rng)
+    policy = np.asarray(policy).ravel() # index y*x_dim+x like the states of BatchGridworld
+
+    returns = np.zeros(rollouts)
+    steps = np.zeros(rollouts, dtype=int)
+    running = np.ones(rollouts, dtype=bool)
+
+    for _ in range(max_steps):
+        _, rewards, terminals = environments.step(policy[environments.agents])
+
+        # finished episodes are reset by the environment, but they do not count any more
+        returns[running] += rewards[running]
+        steps[running] += 1
+        running &= ~terminals
+
+        if not running.any():
+            break
+
+    success = ~running
+    return {"mean_return" : float(returns.mean()), "std_return" : float(returns.std()), "success_rate" : float(success.mean()),
+            "mean_steps" : float(steps.mean()), "steps_percentiles" : dict(zip((50, 90, 99), np.percentile(steps, (50, 90, 99)).tolist())),
+            "returns" : returns, "steps" : steps, "success" : success}
@@ -2,23 +2,14 @@
     File name: Grid.py  
     Author: Eosandra Grund  
     Date created: 20.04.2022  
-    Date last modified: 20.07.2022  
+    Date last modified: 18.10.2026  
     Python Version: 3.10.4 
 '''
 
 import numpy as np
-import os
 import Gridworlds
-
-def clearConsole():
-    '''
-    clears the console
-    '''
-    command = 'clear'
-    # If Machine is running on Windows, use cls
-    if os.name in ('nt', 'dos'): 
-        command = 'cls'
-    os.system(command)
+import Rng
+import ConsoleView
 
 # try new output type
 class Gridworld:
@@ -39,14 +30,21 @@ class Gridworld:
         x_dim (int>0) : x dimension of gridworld   
         y_dim (int>0) : y dimension of gridworld   
         epsilon (0<float<1) : for epsilon-greedy state transition function   
-        agent (list) : [y,x] coordinates of the current agent   
+        flat_states (bool) : if true the states of reset, step and getState are the indices y*x_dim+x instead of [y,x]   
+        agent (list or int) : [y,x] coordinates of the current agent, its index with flat_states   
         initial_agent (list) : [y,x] coordinates of the starting state   
         terminal (list) : [y,x] coordinates of the terminal state   
+        initial_index, terminal_index (int) : indices y*x_dim+x of the starting and the terminal state   
         action (list) : list of all the possible actions in order as strings   
         world (2D list) : [y][x] with values for all states being int for rewards and np.NaN for barriers   
+        random (Rng.RandomStream) : random numbers for the state transition function   
+        profiler (Profiler.Profiler) : measures the time of step if not None   
+        console (ConsoleView.ConsoleRenderer) : draws the gridworld in visualize, created at the first call   
+        next_state (np.array(shape(y*x,len(action)))) : index of the state after each action in each state (states as y*x_dim+x)   
+        reward (np.array(shape(y*x,len(action)))) : reward for each action in each state   
     """
     
-    def __init__(self,gridworld = Gridworlds.Gridworlds.GRIDWORLD1):
+    def __init__(self,gridworld = Gridworlds.Gridworlds.GRIDWORLD1,rng = None,flat_states = False):
         """
         Initializes a gridworld with all parameters   
         gives one positive reward in the terminal state    
@@ -69,34 +67,57 @@ class Gridworld:
             terminal [x,y] = terminal state with a positive reward  
             neg_rewards [[x,y,reward],[x,y,reward],...] = list of fields with negative rewards  
             barrier [[x,y],[x,y],...] = list of fields that are barriers  
+        or instead of neg_rewards and barrier (compact format, e.g. from GridGenerator):   
+            world (np.array(shape(y,x))) = rewards of all fields and np.NaN for barriers  
+
+        ### Arguments:   
+            gridworld (dict) : layout of the gridworld with the keys above  
+            rng (numpy.random.Generator, int or None) : generator or seed for the state transition function, None for a random seed  
+            flat_states (bool) : if true a state is one int y*x_dim+x instead of a [y,x] list (no list per step, the terminal check compares two ints), use toState to show it  
         """
         
         self.x_dim = gridworld["x_dim"]
-        self.y_dim = gridworld["x_dim"]
+        self.y_dim = gridworld["y_dim"]
         self.epsilon = gridworld["epsilon"]
         self.agent = gridworld["start"].copy()
         self.agent.reverse() # [y,x]
         self.initial_agent = self.agent # needed for reset
         self.terminal = gridworld["terminal"].copy()
         self.terminal.reverse()# [y,x]
+        self.initial_index = self.toIndex(self.initial_agent)
+        self.terminal_index = self.toIndex(self.terminal)
+        self.flat_states = flat_states
+        if flat_states:
+            self.agent = self.initial_index
         
         self.action = ['up', 'down' , 'left' , 'right']
+        self.random = Rng.RandomStream(rng, n_actions=len(self.action))
+        self.profiler = None
+        self.console = None
         
-        # create empty gridworld
-        world =np.zeros(shape=(self.y_dim,self.x_dim))
-        
-        # put terminal
-        world[self.terminal[0],self.terminal[1]] = 10 # [y,x]
-        
-        # put negative rewards in gridworld
-        for r in gridworld["neg_reward"]:
-            world[r[1],r[0]] = r[2]
+        if "world" in gridworld:
+            # compact format, the world is already complete
+            world = np.array(gridworld["world"], dtype=float)
+            world[self.terminal[0],self.terminal[1]] = 10 # [y,x]
+        else:
+            # create empty gridworld
+            world =np.zeros(shape=(self.y_dim,self.x_dim))
             
-        # put barrier in gridworld
-        for b in gridworld["barrier"]:
-            world[b[1],b[0]] = np.NaN
+            # put terminal
+            world[self.terminal[0],self.terminal[1]] = 10 # [y,x]
+            
+            # put negative rewards in gridworld, all at once because of large gridworlds
+            neg_reward = np.array(gridworld["neg_reward"], dtype=float).reshape(-1,3)
+            world[neg_reward[:,1].astype(int),neg_reward[:,0].astype(int)] = neg_reward[:,2]
+                
+            # put barrier in gridworld
+            barrier = np.array(gridworld["barrier"], dtype=int).reshape(-1,2)
+            world[barrier[:,1],barrier[:,0]] = np.NaN
         
         self.world = world
+
+        # compile the layout into transition and reward tables once
+        self.next_state, self.reward = self.compileTables()
         
     # getter and setter
     def getXdim(self):
@@ -112,7 +133,22 @@ class Gridworld:
         return self.terminal # [y,x]
     
     def getState(self):
-        return self.agent # [y,x]
+        return self.agent # [y,x] or index with flat_states
+
+    def getNumStates(self):
+        return self.y_dim * self.x_dim
+
+    def toIndex(self,state):
+        """
+        converts a [y,x] state into its index in the transition and reward tables
+        """
+        return state[0] * self.x_dim + state[1]
+
+    def toState(self,index):
+        """
+        converts an index of the transition and reward tables into a [y,x] state
+        """
+        return [int(index // self.x_dim), int(index % self.x_dim)]
     
     # methods
     def isValid(self,x,y):
@@ -126,10 +162,37 @@ class Gridworld:
                 return True
         return False
     
+    def compileTables(self):
+        """
+        applies the movement rules of step to every state and action at once
+
+        ### return:
+            next_state (np.array(shape(y*x,len(action)),dtype=int)) : index of the state after the action (the same state for invalid moves)
+            reward (np.array(shape(y*x,len(action)))) : reward of the move, -0.5 for invalid moves
+        """
+
+        # [dy,dx] for ['up', 'down' , 'left' , 'right']
+        moves = np.array([[-1,0],[1,0],[0,-1],[0,1]])
+
+        y, x = np.divmod(np.arange(self.getNumStates()), self.x_dim)
+        new_y = y[:,None] + moves[:,0] # [state, action]
+        new_x = x[:,None] + moves[:,1]
+
+        # check whether in the Gridworld and not a barrier
+        valid = (new_x >= 0) & (new_x < self.x_dim) & (new_y >= 0) & (new_y < self.y_dim)
+        valid[valid] = ~np.isnan(self.world[new_y[valid],new_x[valid]])
+
+        next_state = np.where(valid, new_y * self.x_dim + new_x, (y * self.x_dim + x)[:,None])
+        reward = np.full(next_state.shape, -0.5) # invalid
+        reward[valid] = self.world[new_y[valid],new_x[valid]]
+        return next_state, reward
+
     def inTerminal(self):
         """
         checks whether the current agent is in the terminal state
         """
+        if self.flat_states:
+            return self.agent == self.terminal_index
         if self.agent == self.terminal: # [y,x]
             return True
         return False
@@ -138,8 +201,11 @@ class Gridworld:
         """
         resets the gridworld to its initial state
         """
-        self.agent = self.initial_agent
-        return self.initial_agent
+        if self.flat_states:
+            self.agent = self.initial_index
+        else:
+            self.agent = self.initial_agent
+        return self.agent
     
     def step(self, action):
         """
@@ -154,95 +220,43 @@ class Gridworld:
             a boolean indication whether this state is terminal
         """
         
+        profiler = self.profiler
+        if profiler is not None:
+            start = profiler.clock()
+
         # state transition policy
         # check whether action or for epsilon random other one
-        take_greedy_action = np.random.choice([True,False],p=[1-self.epsilon, self.epsilon])
-        
-        # take random action
-        if (not take_greedy_action):
-            action = np.random.choice(len(self.action))
+        if self.random.random() < self.epsilon:
+            # take random action
+            action = self.random.action()
             
-        # get new place after action
-        y,x = self.agent[0], self.agent[1] # [y,x]
-        if action == 0: # up
-            y -= 1
-        elif action == 1: # down
-            y += 1
-        elif action == 2: # left
-            x -= 1
-        elif action == 3: # right
-            x += 1
-           
-        # basic reward in case no other for each step
-        reward = -0.1 # for eachs step done
-        
-        # check if action is valid, then do action
-        if self.isValid(x,y):
-            self.agent = [y,x]
-            reward = self.world[self.agent[0],self.agent[1]]
+        # look up new place and reward (invalid moves stay in place with -0.5)
+        if self.flat_states:
+            reward = self.reward[self.agent,action]
+            self.agent = self.next_state[self.agent,action]
         else:
-            # invalid
-            reward = -0.5
+            index = self.toIndex(self.agent)
+            reward = self.reward[index,action]
+            self.agent = self.toState(self.next_state[index,action])
+
+        if profiler is not None:
+            profiler.add("step", profiler.clock() - start)
     
         return self.agent, reward , self.inTerminal()
         
         
-    def visualize(self):
+    def visualize(self,status = None):
         """
-        visualizes the current state
+        visualizes the current state, the board is printed once and afterwards only the agent is moved
+
+        ### Arguments:
+            status (str) : line below the board, e.g. the episode
         """
-        
-        clearConsole()
-        print("")
-        
-        for y in range(self.y_dim):
-            
-            # left side y values
-            firstLine = "    ||"
-            thisLine = ("      " + str(y) + " ||")[-6:]
-            nextLine =  "____||"
-            
-            for x in range(self.x_dim):
-                val = self.world[y,x]
-                
-                # print one field if agent is there or if barrier on bottom line
-                if ([y,x]==self.agent):
-                    nextLine += "__A__|"
-                elif np.array_equal(val, np.NaN, equal_nan=True): # if it is a barrier
-                    nextLine += "XXXXX|"
-                else:
-                    nextLine +=  "_____|"
-                    
-                # print vlaues on field in middle line and first line
-                if (val==0.0): # if 
-                    firstLine += "     |"
-                    thisLine += "     "
-                elif np.array_equal(val, np.NaN, equal_nan=True): # if it is a barrier
-                    firstLine += "XXXXX|"
-                    thisLine += "XXXXX"
-                else: # if it has a reward
-                    firstLine += "     |"
-                    thisLine += ( "     " + str(int(val)) )[-5:]
-                thisLine += "|"
-                
-            print(firstLine)
-            print(thisLine)
-            print(nextLine)
-            
-        # at the bottom of the print, pritn x coordinates
-        topLine = "____||"
-        line = "    ||"
-        middleLine = "    ||"
-        for x in range(self.x_dim):
-            line += "     |"
-            middleLine += ("      " + str(x) + " |")[-6:]
-            topLine += "_____|"
-            
-        print(topLine)
-        print(line)
-        print(middleLine)
-        print(line)
-        print("")
+
+        if self.console is None:
+            self.console = ConsoleView.ConsoleRenderer(self.world)
+        agent = self.toState(self.agent) if self.flat_states else self.agent
+        self.console.draw(agent, status)
 
         
         
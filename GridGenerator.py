@@ -0,0 +1,100 @@
+'''
+    File name: GridGenerator.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+
+def generateGridworld(x_dim, y_dim, barrier_density = 0.2, neg_reward_density = 0.05, neg_reward_range = (-3,-1), epsilon = 0.1, start = None, terminal = None, seed = None, compact = True):
+    """
+    generates a random gridworld dictionary for Grid.Gridworld, the same seed gives the same gridworld
+
+    The terminal state is always reachable: barriers are put anywhere with barrier_density, then a random
+    path that only goes towards the terminal is carved from the start to the terminal state and its fields
+    are kept free of barriers.
+
+    ### Arguments:
+        x_dim (int>0) : x dimension of gridworld
+        y_dim (int>0) : y dimension of gridworld
+        barrier_density (0<= float <1) : probability of each field to be a barrier
+        neg_reward_density (0<= float <=1) : probability of each field to have a negative reward
+        neg_reward_range (tuple) : (lowest, highest) integer negative reward
+        epsilon (0<float<1) : for epsilon-greedy state transition function
+        start [x,y] : starting state, [0,0] if None
+        terminal [x,y] : terminal state, [x_dim-1,y_dim-1] if None
+        seed (int or None) : seed for the layout
+        compact (bool) : if true the dictionary contains the whole world as np.array (key world),
+            otherwise the lists neg_reward and barrier like in Gridworlds
+
+    ### return:
+        gridworld (dict) : layout for Grid.Gridworld
+    """
+
+    rng = np.random.default_rng(seed)
+    start = [0,0] if start is None else list(start)
+    terminal = [x_dim-1,y_dim-1] if terminal is None else list(terminal)
+
+    # [y,x] world with negative rewards and barriers
+    world = np.zeros(shape=(y_dim,x_dim))
+    neg_reward = rng.random(size=(y_dim,x_dim)) < neg_reward_density
+    world[neg_reward] = rng.integers(neg_reward_range[0], neg_reward_range[1] + 1, size=np.count_nonzero(neg_reward))
+    world[rng.random(size=(y_dim,x_dim)) < barrier_density] = np.nan
+
+    # carve the path: all steps in x and y direction towards the terminal in random order
+    dx, dy = terminal[0] - start[0], terminal[1] - start[1]
+    moves = np.zeros(shape=(abs(dx) + abs(dy),2), dtype=int) # [y,x]
+    moves[:abs(dx),1] = np.sign(dx)
+    moves[abs(dx):,0] = np.sign(dy)
+    rng.shuffle(moves)
+    path = np.vstack([[start[1],start[0]], [start[1],start[0]] + np.cumsum(moves, axis=0)])
+    path_values = world[path[:,0],path[:,1]]
+    world[path[:,0],path[:,1]] = np.where(np.isnan(path_values), 0.0, path_values)
+
+    world[start[1],start[0]] = 0.0
+    world[terminal[1],terminal[0]] = 10.0
+
+    gridworld = {"x_dim" : x_dim, "y_dim" : y_dim, "epsilon" : epsilon, "start" : start, "terminal" : terminal}
+    if compact:
+        gridworld["world"] = world
+        return gridworld
+
+    # list format like in Gridworlds, [x,y] coordinates
+    y, x = np.nonzero(world < 0)
+    gridworld["neg_reward"] = [[int(a), int(b), int(world[b,a])] for a, b in zip(x, y)]
+    y, x = np.nonzero(np.isnan(world))
+    gridworld["barrier"] = [[int(a), int(b)] for a, b in zip(x, y)]
+    return gridworld
+
+def saveGridworld(path, gridworld):
+    """
+    saves a gridworld dictionary in the compact format as .npz file
+    """
+    world = gridworld["world"] if "world" in gridworld else toWorld(gridworld)
+    np.savez_compressed(path, world=world, epsilon=gridworld["epsilon"], start=gridworld["start"], terminal=gridworld["terminal"])
+
+def loadGridworld(path):
+    """
+    loads a gridworld saved with saveGridworld
+
+    ### return:
+        gridworld (dict) : layout for Grid.Gridworld in the compact format
+    """
+    with np.load(path) as data:
+        world = data["world"]
+        return {"x_dim" : world.shape[1], "y_dim" : world.shape[0], "epsilon" : float(data["epsilon"]),
+                "start" : data["start"].tolist(), "terminal" : data["terminal"].tolist(), "world" : world}
+
+def toWorld(gridworld):
+    """
+    converts a gridworld dictionary in the list format to the world array of the compact format
+    """
+    world = np.zeros(shape=(gridworld["y_dim"],gridworld["x_dim"]))
+    for x, y, reward in gridworld["neg_reward"]:
+        world[y,x] = reward
+    for x, y in gridworld["barrier"]:
+        world[y,x] = np.nan
+    world[gridworld["terminal"][1],gridworld["terminal"][0]] = 10.0
+    return world
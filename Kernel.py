@@ -0,0 +1,139 @@
+'''
+    File name: Kernel.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        without numba the kernel runs as normal python function
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+@njit(cache=True)
+def epsilonGreedy(q, state, epsilon, rng):
+    """
+    epsilon-greedy action of SARSAn.policy for a state index, ties go to the first action like np.argmax
+    """
+    n_actions = q.shape[0]
+    if rng.random() < epsilon:
+        return rng.integers(0, n_actions)
+
+    best = 0
+    for a in range(1, n_actions):
+        if q[a, state] > q[best, state]:
+            best = a
+    return best
+
+@njit(cache=True)
+def runEpisode(q, next_state, reward, start, terminal, n, gamma, alpha, epsilon, env_epsilon, rng):
+    """
+    runs one whole episode of n-step SARSA with the same updates as SARSAn.episode
+    on the transition and reward tables of Grid.Gridworld
+
+    ### Arguments:
+        q (np.array(shape(len(action), y*x))) : q-values of all states (view of SARSAn.q), updated in place
+        next_state (np.array(shape(y*x, len(action)))) : Gridworld.next_state
+        reward (np.array(shape(y*x, len(action)))) : Gridworld.reward
+        start (int) : index of the starting state
+        terminal (int) : index of the terminal state
+        n (int) : amount of steps, -1 for Monte Carlo
+        gamma (0<= float <= 1) : discount for future rewards
+        alpha (0<= float <= 1) : stepsize (learning rate)
+        epsilon (0<= float <= 1) : for the epsilon-greedy policy
+        env_epsilon (0<= float <= 1) : for the state transition function of the gridworld
+        rng (numpy.random.Generator) : random numbers of the policy and the gridworld, its state advances
+            (with and without numba, the global random state of numpy is not used)
+
+    ### return:
+        returns (float) : total return of the episode
+        steps (int) : amount of steps of the episode
+    """
+
+    n_actions = q.shape[0]
+    monte_carlo = n < 0
+
+    # ring buffer of the last n+2 steps, or the whole episode for Monte Carlo
+    capacity = 64 if monte_carlo else n + 2
+    states = np.empty(capacity, dtype=np.int64)
+    actions = np.empty(capacity, dtype=np.int64)
+    rewards = np.empty(capacity, dtype=np.float64)
+
+    states[0] = start
+    actions[0] = epsilonGreedy(q, start, epsilon, rng)
+
+    t = 0
+    t_update = 0
+    terminal_state_index = -1 # T, -1 until we found it
+    gamma_n = gamma ** n if not monte_carlo else 0.0
+    returns = 0.0
+
+    while True:
+
+        # make space for the next step
+        if monte_carlo and t + 2 > capacity:
+            capacity *= 2
+            states = np.concatenate((states, np.empty_like(states)))
+            actions = np.concatenate((actions, np.empty_like(actions)))
+            rewards = np.concatenate((rewards, np.empty_like(rewards)))
+
+        # make step with the state transition function of the gridworld
+        s = states[t % capacity]
+        a = actions[t % capacity]
+        if rng.random() < env_epsilon:
+            a = rng.integers(0, n_actions)
+        r = reward[s, a]
+        s_next = next_state[s, a]
+        returns += r
+
+        at_terminal = s_next == terminal
+        states[(t+1) % capacity] = s_next
+        actions[(t+1) % capacity] = epsilonGreedy(q, s_next, epsilon, rng)
+        rewards[t % capacity] = r
+
+        if at_terminal:
+            terminal_state_index = t + 1
+            if monte_carlo:
+                # all the returns until the terminal state at once
+                for i in range(t - 1, -1, -1):
+                    rewards[i] += gamma * rewards[i+1]
+
+        while at_terminal or (not monte_carlo and t_update + n <= t):
+
+            # we do not want to update the terminal state
+            if states[t_update % capacity] == terminal:
+                break
+
+            if monte_carlo:
+                estimate = rewards[t_update]
+            else:
+                end = t_update + n
+                if terminal_state_index >= 0 and terminal_state_index < end:
+                    end = terminal_state_index
+                estimate = 0.0
+                for i in range(end - 1, t_update - 1, -1):
+                    estimate = rewards[i % capacity] + gamma * estimate
+
+                if terminal_state_index < 0 or t_update + n < terminal_state_index:
+                    future = (t_update + n) % capacity
+                    estimate += gamma_n * q[actions[future], states[future]]
+
+            update = t_update % capacity
+            q[actions[update], states[update]] += alpha * (estimate - q[actions[update], states[update]])
+            t_update += 1
+
+        if at_terminal:
+            return returns, t + 1
+        t += 1
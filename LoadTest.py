@@ -0,0 +1,103 @@
+'''
+    File name: LoadTest.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import argparse
+import asyncio
+import json
+import time
+import numpy as np
+import Grid
+import Gridworlds
+import PolicyClient
+import PolicyServer
+
+async def runClient(client, states, requests, batch, rng, latencies):
+    """
+    sends requests one after the other, each with batch random states
+    """
+    for _ in range(requests):
+        chosen = states[rng.integers(len(states), size=batch)]
+        start = time.perf_counter()
+        await client.actions(chosen)
+        latencies.append(time.perf_counter() - start)
+
+async def loadTest(path = None, host = "127.0.0.1", port = 8765, clients = 50, requests = 100, batch = 16, shape = None, seed = 0):
+    """
+    many clients ask a PolicyServer at the same time
+
+    ### Arguments:
+        path, host, port : where the server listens, see PolicyClient.connect
+        clients (int > 0) : amount of connections sending at the same time
+        requests (int > 0) : requests per client
+        batch (int > 0) : states per request
+        shape (tuple) : (y,x) of the gridworld, the states are drawn from it
+        seed (int) : seed for the states
+
+    ### return:
+        results (dict) : requests and states per second, latency percentiles (50, 90, 99 %) in milliseconds
+            measured by the clients and the stats of the server
+    """
+
+    rng = np.random.default_rng(seed)
+    states = np.stack(np.meshgrid(np.arange(shape[0]), np.arange(shape[1]), indexing="ij"), axis=-1).reshape(-1, 2)
+    connections = [await PolicyClient.PolicyClient.connect(path=path, host=host, port=port) for _ in range(clients)]
+
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(runClient(client, states, requests, batch, np.random.default_rng(rng.integers(2**32)), latencies) for client in connections))
+    seconds = time.perf_counter() - start
+
+    server_stats = await connections[0].stats()
+    for client in connections:
+        await client.close()
+
+    percentiles = np.percentile(latencies, (50, 90, 99)) * 1000
+    return {
+        "requests_per_second" : len(latencies) / seconds,
+        "states_per_second" : len(latencies) * batch / seconds,
+        "latency_ms" : {"50" : float(percentiles[0]), "90" : float(percentiles[1]), "99" : float(percentiles[2])},
+        "server" : server_stats,
+    }
+
+async def selfTest(args):
+    """
+    starts a server with random q-values for the gridworld in this process and tests it
+    """
+    world = Grid.Gridworld(Gridworlds.Gridworlds.GRIDWORLD[args.gridworld])
+    q = np.random.default_rng(args.seed).normal(size=(len(world.getActions()), world.getYdim(), world.getXdim()))
+    server = PolicyServer.PolicyServer(q, max_batch=args.max_batch, max_delay=args.max_delay)
+    listening = await server.start(path=args.path)
+    port = None if args.path is not None else listening.sockets[0].getsockname()[1]
+    try:
+        return await loadTest(path=args.path, port=port, clients=args.clients, requests=args.requests, batch=args.batch, shape=q.shape[1:], seed=args.seed)
+    finally:
+        await server.close()
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description = "load test of a PolicyServer")
+    parser.add_argument("--serve", action = "store_true", help = "start a server with random q-values in this process")
+    parser.add_argument("--gridworld", type = int, default = 0, help = "index of the gridworld, for the states and with --serve the q-values")
+    parser.add_argument("--path", default = None, help = "Unix socket, otherwise TCP on --host and --port")
+    parser.add_argument("--host", default = "127.0.0.1")
+    parser.add_argument("--port", type = int, default = 8765)
+    parser.add_argument("--clients", type = int, default = 50)
+    parser.add_argument("--requests", type = int, default = 100)
+    parser.add_argument("--batch", type = int, default = 16)
+    parser.add_argument("--max-batch", type = int, default = 1024)
+    parser.add_argument("--max-delay", type = float, default = 0.0)
+    parser.add_argument("--seed", type = int, default = 0)
+    args = parser.parse_args()
+
+    if args.serve:
+        results = asyncio.run(selfTest(args))
+    else:
+        world = Grid.Gridworld(Gridworlds.Gridworlds.GRIDWORLD[args.gridworld])
+        results = asyncio.run(loadTest(path = args.path, host = args.host, port = args.port, clients = args.clients, requests = args.requests,
+                                       batch = args.batch, shape = (world.getYdim(), world.getXdim()), seed = args.seed))
+    print(json.dumps(results, indent = 2))
@@ -2,11 +2,10 @@
     File name: Main_SARSA.py
     Author: Eosandra Grund
     Date created: 16.07.2022
-    Date last modified: 20.07.2022
+    Date last modified: 18.10.2026
     Python Version: 3.10.4
 '''
 
-import matplotlib.pyplot as plt
 import numpy as np
 import SARSAn
 import Grid
@@ -29,4 +28,5 @@ if __name__ == "__main__":
     player.start(episodes = 50, evaluation = True)
 
     # in case you want to save all the plots you created in a picture
+    #import matplotlib.pyplot as plt
     #plt.savefig("Figure_SARSA_policy_returns.png")
\ No newline at end of file
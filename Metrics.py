@@ -0,0 +1,129 @@
+'''
+    File name: Metrics.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import csv
+import json
+import os
+import numpy as np
+
+class MetricsCollector:
+    """
+    Collects the statistics of each episode, can be given to SARSAn as callback
+
+    Each record is a dictionary with the keys episode, average_return, return, steps and epsilon.
+
+    ### Attributes:
+        records (list) : all the records in the order they were given
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def __call__(self,record):
+        """
+        stores the record of one episode
+        """
+        self.records.append(record)
+
+    def __len__(self):
+        return len(self.records)
+
+    def toArrays(self):
+        """
+        ### return:
+            arrays (dict) : for each key an np.array with the values of all episodes
+        """
+        keys = self.records[0].keys() if self.records else []
+        return {key : np.array([record[key] for record in self.records]) for key in keys}
+
+class MetricsLog:
+    """
+    Append-only log of the records of each episode on disk, can be given to SARSAn as callback
+
+    The records are written in blocks of buffer_size, so a long run needs only little memory and
+    the file can be read while the training is still running (see readLog).
+
+    ### Attributes:
+        path (str) : file of the log
+        format (str) : "csv" or "jsonl" (one json object per line)
+        buffer_size (int > 0) : amount of records that are written at once
+        fields (list) : columns of the csv file, the keys of the first record
+    """
+
+    def __init__(self,path,format = None,buffer_size = 100):
+        """
+        ### Arguments:
+            path (str) : file of the log, new records are appended if it exists
+            format (str) : "csv" or "jsonl", from the file extension if None
+            buffer_size (int > 0) : amount of records that are written at once
+        """
+        self.path = path
+        self.format = format if format is not None else ("jsonl" if path.endswith(".jsonl") else "csv")
+        if self.format not in ("csv", "jsonl"):
+            raise ValueError("format has to be 'csv' or 'jsonl', not " + repr(self.format))
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.fields = None
+
+    def __call__(self,record):
+        """
+        stores the record of one episode, the buffer is written when it is full
+        """
+        self.buffer.append(record)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        writes all buffered records to the file
+        """
+        if not self.buffer:
+            return
+
+        with open(self.path, "a", newline="") as file:
+            if self.format == "jsonl":
+                file.write("".join(json.dumps(record) + "\n" for record in self.buffer))
+            else:
+                if self.fields is None:
+                    self.fields = list(self.buffer[0].keys())
+                writer = csv.DictWriter(file, fieldnames=self.fields)
+                # header only at the beginning of a new file
+                if file.tell() == 0:
+                    writer.writeheader()
+                writer.writerows(self.buffer)
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exception):
+        self.close()
+
+def readLog(path):
+    """
+    reads a log of MetricsLog, also while it is still written
+
+    ### return:
+        arrays (dict) : for each key an np.array with the values of all episodes
+    """
+    collector = MetricsCollector()
+    if not os.path.isfile(path):
+        return collector.toArrays()
+
+    with open(path, newline="") as file:
+        if path.endswith(".jsonl"):
+            for line in file:
+                if line.strip():
+                    collector(json.loads(line))
+        else:
+            for row in csv.DictReader(file):
+                collector({key : float(value) for key, value in row.items()})
+    return collector.toArrays()
@@ -0,0 +1,145 @@
+'''
+    File name: Planning.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import heapq
+import numpy as np
+
+class PrioritizedSweeping:
+    """
+    Dyna planning with prioritized sweeping on a model learned from the real steps
+
+    The model stores the usual next state and reward of every state-action (the gridworld is almost
+    deterministic, the outcome of the majority of the steps is kept) and for every state the
+    state-actions that led there. After each real step the state-action gets the priority |TD error|,
+    and plan does the backups with the highest priorities first. After a backup of a state all state-actions leading to it get a new priority, so
+    the rewards flow backwards through the model without new steps in the gridworld.
+    The backups use the estimate of expected SARSA for the epsilon-greedy policy of the agent,
+    r + gamma * ((1 - epsilon) * max q(next state) + epsilon * mean q(next state)), so they learn the same
+    values as the SARSA updates (prioritized sweeping in Sutton & Barto, chapter 8.4, uses the max).
+    The planning starts when the terminal state was found for the first time.
+
+    ### Attributes:
+        gamma (0<= float <= 1) : discount for future rewards
+        alpha (0<= float <= 1) : stepsize of the backups
+        theta (float >= 0) : only state-actions with a priority larger than theta are planned
+        epsilon (0<= float <= 1) : epsilon of the policy of the agent, set before each step
+        x_dim (int > 0) : x dimension of the gridworld, states are stored as y*x_dim+x
+        next_state (np.array(shape(len(action) , y*x),dtype=int)) : observed next state, -1 if never tried
+        reward (np.array(shape(len(action) , y*x))) : observed reward
+        terminal (np.array(shape(len(action) , y*x),dtype=bool)) : if the observed next state is terminal
+        count (np.array(shape(len(action) , y*x),dtype=int)) : votes for the stored outcome, a different one replaces it at 0
+        predecessors (dict) : state : set of (action, state) that led to it
+        priority (np.array(shape(len(action) , y*x))) : priority of each state-action in the queue, 0 if not in it
+        queue (list) : heap of (-priority, action, state), can contain old entries
+    """
+
+    def __init__(self,shape,gamma,alpha,theta = 1e-4):
+        """
+        ### Arguments:
+            shape (tuple) : (len(action) , y , x), the shape of the q-values
+            gamma (0<= float <= 1) : discount for future rewards
+            alpha (0<= float <= 1) : stepsize of the backups
+            theta (float >= 0) : only state-actions with a priority larger than theta are planned
+        """
+
+        n_actions, y_dim, x_dim = shape
+        self.gamma = gamma
+        self.alpha = alpha
+        self.theta = theta
+        self.epsilon = 0.0
+        self.x_dim = x_dim
+
+        self.next_state = np.full((n_actions, y_dim * x_dim), -1, dtype=int)
+        self.reward = np.zeros((n_actions, y_dim * x_dim))
+        self.terminal = np.zeros((n_actions, y_dim * x_dim), dtype=bool)
+        self.count = np.zeros((n_actions, y_dim * x_dim), dtype=int)
+        self.predecessors = {}
+        self.priority = np.zeros((n_actions, y_dim * x_dim))
+        self.queue = []
+
+    def estimate(self,q,action,state):
+        """
+        expected SARSA estimate of the state-action (state index) after the model
+        """
+        if self.terminal[action,state]:
+            return self.reward[action,state]
+        y, x = divmod(int(self.next_state[action,state]), self.x_dim)
+        values = q[:,y,x]
+        return self.reward[action,state] + self.gamma * ((1 - self.epsilon) * max(values) + self.epsilon * sum(values) / len(values))
+
+    def push(self,q,action,state):
+        """
+        puts the state-action (state index) in the queue if its TD error is larger than theta
+        """
+        y, x = divmod(state, self.x_dim)
+        priority = abs(self.estimate(q, action, state) - q[action,y,x])
+        if priority > self.theta and priority > self.priority[action,state]:
+            self.priority[action,state] = priority
+            heapq.heappush(self.queue, (-priority, action, state))
+
+    def observe(self,q,state,action,reward,next_state,terminal):
+        """
+        adds a real step to the model and queues it
+
+        ### Arguments:
+            q (np.array(shape(len(action) , y , x))) : q-values
+            state, next_state [y,x] : states before and after the step
+            action (int) : index of the action taken
+            reward (float) : reward of the step
+            terminal (bool) : if next_state is the terminal state
+        """
+
+        s = int(state[0]) * self.x_dim + int(state[1])
+        s_next = int(next_state[0]) * self.x_dim + int(next_state[1])
+
+        # majority vote, so a random action of the gridworld does not replace the usual outcome
+        old = self.next_state[action,s]
+        if old == s_next:
+            self.count[action,s] += 1
+        else:
+            self.count[action,s] -= 1
+            if self.count[action,s] <= 0:
+                if old >= 0:
+                    self.predecessors[old].discard((action, s))
+                self.predecessors.setdefault(s_next, set()).add((action, s))
+                self.next_state[action,s] = s_next
+                self.reward[action,s] = reward
+                self.terminal[action,s] = terminal
+                self.count[action,s] = 1
+
+        self.push(q, action, s)
+
+    def plan(self,q,steps):
+        """
+        does at most steps backups in the order of the priorities, updates q in place
+
+        ### return:
+            backups (int) : amount of backups done (less if the queue got empty)
+        """
+
+        # before the terminal state was found, the model only knows the penalties, planning them
+        # makes every wall look bad and the agent stays in the middle without finding the terminal state
+        if not self.terminal.any():
+            return 0
+
+        backups = 0
+        while backups < steps and self.queue:
+            priority, action, s = heapq.heappop(self.queue)
+            if -priority != self.priority[action,s]: # old entry, the state-action was queued again
+                continue
+            self.priority[action,s] = 0.0
+
+            y, x = divmod(s, self.x_dim)
+            q[action,y,x] += self.alpha * (self.estimate(q, action, s) - q[action,y,x])
+            backups += 1
+
+            # the value of s changed, so the state-actions leading to it have new TD errors
+            for previous_action, previous in self.predecessors.get(s, ()):
+                self.push(q, previous_action, previous)
+
+        return backups
@@ -0,0 +1,121 @@
+'''
+    File name: PolicyClient.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import asyncio
+import itertools
+import json
+import numpy as np
+import PolicyServer
+
+class PolicyClient:
+    """
+    Asks a PolicyServer.PolicyServer for greedy actions
+
+    One connection can have many open requests at the same time (e.g. from several tasks with
+    asyncio.gather), the answers are matched to the requests by their id.
+
+        client = await PolicyClient.connect(path = "policy.sock")
+        actions = await client.actions([[0,0],[3,4]])
+        await client.close()
+
+    ### Attributes:
+        reader, writer : the asyncio streams of the connection
+        waiting (dict) : id : future of each open request
+    """
+
+    def __init__(self,reader,writer):
+        """
+        ### Arguments:
+            reader, writer : asyncio streams of an open connection, use connect to open one
+        """
+        self.reader = reader
+        self.writer = writer
+        self.waiting = {}
+        self.ids = itertools.count()
+        self.receiver = asyncio.ensure_future(self.receive())
+
+    @classmethod
+    async def connect(cls,path = None,host = "127.0.0.1",port = 8765):
+        """
+        connects to the Unix socket path, or to host and port if path is None
+
+        ### return:
+            client (PolicyClient) : the connected client
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=PolicyServer.LINE_LIMIT)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=PolicyServer.LINE_LIMIT)
+        return cls(reader, writer)
+
+    async def receive(self):
+        """
+        gives each answer to the request with the same id, runs as long as the connection
+        """
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self.waiting.pop(response.get("id"), None)
+                if future is None or future.done():
+                    continue
+                if "error" in response:
+                    future.set_exception(ValueError(response["error"]))
+                else:
+                    future.set_result(response)
+        finally:
+            # the connection is closed, no answers will come
+            for future in self.waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("connection to the policy server closed"))
+            self.waiting.clear()
+
+    async def request(self,request):
+        """
+        sends a request (dict) and returns the answer (dict)
+        """
+        if self.receiver.done():
+            raise ConnectionError("connection to the policy server closed")
+        request["id"] = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[request["id"]] = future
+        self.writer.write((json.dumps(request) + "\n").encode())
+        await self.writer.drain()
+        return await future
+
+    async def actions(self,states):
+        """
+        ### Arguments:
+            states (list or np.array(shape(k,2))) : [y,x] states
+
+        ### return:
+            actions (np.array(shape(k),dtype=int)) : greedy action of each state
+        """
+        response = await self.request({"states" : np.asarray(states, dtype=int).tolist()})
+        return np.array(response["actions"], dtype=int)
+
+    async def stats(self):
+        """
+        ### return:
+            stats (dict) : statistics of the server, see PolicyServer.stats
+        """
+        response = await self.request({"stats" : True})
+        return response["stats"]
+
+    async def close(self):
+        """
+        closes the connection
+        """
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        self.receiver.cancel()
@@ -0,0 +1,265 @@
+'''
+    File name: PolicyServer.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import argparse
+import asyncio
+import json
+import time
+import numpy as np
+import Checkpoint
+import Grid
+import Gridworlds
+
+# longest request line in bytes (about a million states)
+LINE_LIMIT = 2**24
+
+class PolicyServer:
+    """
+    Serves the greedy actions of a q-table to other processes
+
+    The protocol is one json object per line, over a Unix socket or TCP on localhost:
+        {"id": 1, "states": [[y,x], ...]}  ->  {"id": 1, "actions": [0, 3, ...]}
+        {"id": 2, "stats": true}           ->  {"id": 2, "stats": {...}}
+        an invalid request                 ->  {"id": ..., "error": "..."}
+    Requests that arrive at the same time (from all connections, also several open requests on one
+    connection) are collected and answered with one argmax over q for all their states.
+
+    ### Attributes:
+        q (np.array(shape(len(action) , y , x))) : the q-values, e.g. memory-mapped from a checkpoint
+        max_batch (int > 0) : at most this many requests are answered together
+        max_delay (float >= 0) : seconds to wait for more requests before a batch is answered
+        pending (asyncio.Queue) : (states, future, time) of the requests not answered yet
+        latencies (np.array) : ring buffer of the latencies of the last requests in seconds
+        requests, states, batches (int) : amount of answered requests, states and batches
+    """
+
+    def __init__(self,q,max_batch = 1024,max_delay = 0.0,latency_window = 10000):
+        """
+        ### Arguments:
+            q (np.array(shape(len(action) , y , x))) : the q-values
+            max_batch (int > 0) : at most this many requests are answered together
+            max_delay (float >= 0) : seconds to wait for more requests before a batch is answered
+            latency_window (int > 0) : the latency percentiles are calculated over this many last requests
+        """
+
+        self.q = q
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.pending = None # created in the event loop by start
+        self.latencies = np.zeros(latency_window)
+        self.requests = 0
+        self.states = 0
+        self.batches = 0
+        self.servers = []
+        self.batcher = None
+
+    async def start(self,path = None,host = "127.0.0.1",port = 0):
+        """
+        starts listening on the Unix socket path, or on host and port if path is None (port 0 for a free port)
+
+        ### return:
+            server (asyncio.Server) : the listening server, e.g. for server.sockets[0].getsockname()
+        """
+
+        if self.pending is None:
+            self.pending = asyncio.Queue()
+            self.batcher = asyncio.ensure_future(self.answerBatches())
+
+        if path is not None:
+            server = await asyncio.start_unix_server(self.handle, path=path, limit=LINE_LIMIT)
+        else:
+            server = await asyncio.start_server(self.handle, host=host, port=port, limit=LINE_LIMIT)
+        self.servers.append(server)
+        return server
+
+    async def close(self):
+        """
+        stops listening and answering
+        """
+        for server in self.servers:
+            server.close()
+            await server.wait_closed()
+        if self.batcher is not None:
+            self.batcher.cancel()
+
+    async def actions(self,states):
+        """
+        greedy actions of the states, answered together with all other pending requests
+
+        ### Arguments:
+            states (np.array(shape(k,2),dtype=int)) : [y,x] states
+
+        ### return:
+            actions (np.array(shape(k),dtype=int)) : index of the best action in each state
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.pending.put_nowait((states, future, time.perf_counter()))
+        return await future
+
+    async def answerBatches(self):
+        """
+        answers all pending requests together, runs as long as the server
+        """
+
+        while True:
+            batch = [await self.pending.get()]
+            if self.max_delay > 0:
+                await asyncio.sleep(self.max_delay)
+            while len(batch) < self.max_batch and not self.pending.empty():
+                batch.append(self.pending.get_nowait())
+
+            # one argmax for all states of all requests
+            states = np.concatenate([states for states, _, _ in batch])
+            actions = np.argmax(self.q[:, states[:,0], states[:,1]], axis=0)
+
+            now = time.perf_counter()
+            start = 0
+            for states, future, arrival in batch:
+                if not future.done():
+                    future.set_result(actions[start:start + len(states)])
+                start += len(states)
+                self.latencies[self.requests % len(self.latencies)] = now - arrival
+                self.requests += 1
+
+            self.states += len(actions)
+            self.batches += 1
+
+    def parseStates(self,states):
+        """
+        checks the states of a request
+
+        ### return:
+            states (np.array(shape(k,2),dtype=int)) : [y,x] states inside the gridworld
+        """
+        states = np.asarray(states)
+        # check the type before casting, floats and too large ints would wrap around or be rounded
+        if states.size > 0 and states.dtype.kind not in "iu":
+            raise ValueError("states have to be [y,x] pairs of integers")
+        states = states.reshape(-1, 2)
+        _, y_dim, x_dim = self.q.shape
+        if ((states < 0) | (states >= (y_dim, x_dim))).any():
+            raise ValueError("states have to be inside the gridworld of size y " + str(y_dim) + ", x " + str(x_dim))
+        return states.astype(int)
+
+    async def answer(self,request,writer):
+        """
+        answers one request of a connection
+        """
+        try:
+            if request.get("stats"):
+                response = {"stats" : self.stats()}
+            else:
+                actions = await self.actions(self.parseStates(request["states"]))
+                response = {"actions" : actions.tolist()}
+        except (KeyError, TypeError, ValueError, OverflowError) as error:
+            response = {"error" : str(error)}
+
+        response["id"] = request.get("id")
+        writer.write((json.dumps(response) + "\n").encode())
+
+    async def handle(self,reader,writer):
+        """
+        reads the requests of one connection, they are answered in parallel so open requests of one client are batched too
+        """
+
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("a request has to be a json object")
+                except ValueError as error:
+                    writer.write((json.dumps({"id" : None, "error" : str(error)}) + "\n").encode())
+                    continue
+                task = asyncio.ensure_future(self.answer(request, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                await writer.drain()
+            if tasks:
+                await asyncio.gather(*tasks)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def stats(self):
+        """
+        ### return:
+            stats (dict) : amount of requests, states and batches, mean requests per batch and the
+                latency percentiles (50, 90, 99 %) in milliseconds of the last requests
+        """
+        latencies = self.latencies[:min(self.requests, len(self.latencies))]
+        percentiles = np.percentile(latencies, (50, 90, 99)) * 1000 if len(latencies) else np.full(3, np.nan)
+        return {
+            "requests" : self.requests,
+            "states" : self.states,
+            "batches" : self.batches,
+            "mean_batch" : self.requests / max(self.batches, 1),
+            "latency_ms" : {"50" : float(percentiles[0]), "90" : float(percentiles[1]), "99" : float(percentiles[2])},
+        }
+
+def loadQ(checkpoint = None,q_file = None,gridworld = None):
+    """
+    loads the q-values for the server, memory-mapped read-only
+
+    ### Arguments:
+        checkpoint (str) : directory of a checkpoint (Checkpoint.save)
+        q_file (str) : .npy file with the q-values, if no checkpoint is given
+        gridworld (int) : index in Gridworlds.Gridworlds.GRIDWORLD, to check that the q-values fit its layout
+
+    ### return:
+        q (np.array(shape(len(action) , y , x))) : the q-values
+    """
+
+    q = Checkpoint.loadQ(checkpoint) if checkpoint is not None else np.load(q_file, mmap_mode="r")
+
+    if gridworld is not None:
+        world = Grid.Gridworld(Gridworlds.Gridworlds.GRIDWORLD[gridworld])
+        shape = (len(world.getActions()), world.getYdim(), world.getXdim())
+        if q.shape != shape:
+            raise ValueError("q-values of shape " + str(q.shape) + " do not fit gridworld " + str(gridworld) + " with " + str(shape))
+    return q
+
+async def serve(q,path = None,host = "127.0.0.1",port = 0,max_batch = 1024,max_delay = 0.0):
+    """
+    runs a PolicyServer until it is cancelled
+    """
+    server = PolicyServer(q, max_batch=max_batch, max_delay=max_delay)
+    listening = await server.start(path=path, host=host, port=port)
+    print("serving q-values of shape", q.shape, "on", listening.sockets[0].getsockname(), flush=True)
+    try:
+        await listening.serve_forever()
+    finally:
+        await server.close()
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description = "serves the greedy actions of a q-table over a Unix socket or TCP on localhost")
+    parser.add_argument("--checkpoint", default = None, help = "checkpoint directory with the q-values")
+    parser.add_argument("--q", default = None, help = ".npy file with the q-values, if there is no checkpoint")
+    parser.add_argument("--gridworld", type = int, default = None, help = "index of the gridworld, to check the shape of the q-values")
+    parser.add_argument("--path", default = None, help = "Unix socket, otherwise TCP on --host and --port")
+    parser.add_argument("--host", default = "127.0.0.1")
+    parser.add_argument("--port", type = int, default = 8765)
+    parser.add_argument("--max-batch", type = int, default = 1024)
+    parser.add_argument("--max-delay", type = float, default = 0.0, help = "seconds to wait for more requests before answering")
+    args = parser.parse_args()
+
+    if args.checkpoint is None and args.q is None:
+        parser.error("give --checkpoint or --q")
+
+    q = loadQ(checkpoint = args.checkpoint, q_file = args.q, gridworld = args.gridworld)
+    try:
+        asyncio.run(serve(q, path = args.path, host = args.host, port = args.port, max_batch = args.max_batch, max_delay = args.max_delay))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,213 @@
+'''
+    File name: PolicyView.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import multiprocessing
+import queue
+import time
+import numpy as np
+
+class PolicyRenderer:
+    """
+    Heatmaps of the q-values of each action, updated in place
+
+    The figure, one image per action and the text of each field are created once, a redraw only
+    changes their data. Redraws are throttled: draw is only due if at least every episodes and
+    interval seconds passed since the last one. The values are only written into the fields
+    if the gridworld has at most max_text fields, because text does not scale to large grids.
+
+    ### Attributes:
+        actions (list) : names of the actions in order, the titles of the heatmaps
+        every (int > 0) : at most one redraw every this many episodes
+        interval (float >= 0) : at least this many seconds between two redraws
+        fig, axes : matplotlib figure and 3*3 axes, the actions are in the middle of each side
+        images (list) : the image of each action
+        texts (list) : np.array(shape(y,x)) of text artists for each action, empty without text
+    """
+
+    def __init__(self,actions,shape,every = 1,interval = 0.0,max_text = 400):
+        """
+        ### Arguments:
+            actions (list) : names of the actions in order
+            shape (tuple) : (y,x) shape of the gridworld
+            every (int > 0) : at most one redraw every this many episodes
+            interval (float >= 0) : at least this many seconds between two redraws
+            max_text (int >= 0) : write the values into the fields only if there are at most this many
+        """
+        import matplotlib.pyplot as plt
+        import matplotlib.patheffects as PathEffects
+
+        self.actions = actions
+        self.every = every
+        self.interval = interval
+        self.episodes = every # since the last redraw, so the first one is due
+        self.last_draw = -np.inf
+
+        # go in interactive mode
+        plt.ion()
+        # show visualizatin without blocking the caluclations
+        plt.show(block=False)
+
+        self.fig, self.axes = plt.subplots(3,3, num ='SARSAn State', clear=True)
+        for ax in self.axes.flat:
+            ax.axis('off')
+        self.fig.suptitle("Policy ",fontsize=18)
+
+        y_dim, x_dim = shape
+        empty = np.zeros(shape)
+        with_text = y_dim * x_dim <= max_text
+        self.images = []
+        self.texts = []
+        for i, action in enumerate(actions):
+            ax = self.axes.flat[2*i + 1]
+            ax.axis('on')
+            ax.set(title = action)
+            if with_text:
+                ax.set_xticks(np.arange(x_dim))
+                ax.set_yticks(np.arange(y_dim))
+            self.images.append(ax.imshow(empty, interpolation='None'))
+
+            texts = np.empty(shape, dtype=object)
+            if with_text:
+                for y in range(y_dim):
+                    for x in range(x_dim):
+                        texts[y,x] = ax.text(x, y, "", ha="center", va="center", color="black", fontsize=8,
+                                             path_effects=[PathEffects.withStroke(linewidth=1, foreground="w")])
+            self.texts.append(texts if with_text else np.empty((0,0), dtype=object))
+
+    def due(self):
+        """
+        counts one episode and returns whether a redraw is allowed now
+        """
+        self.episodes += 1
+        return self.episodes >= self.every and time.perf_counter() - self.last_draw >= self.interval
+
+    def draw(self,q):
+        """
+        shows the q-values (np.array(shape(len(action) , y , x)))
+        """
+        for i in range(len(self.actions)):
+            values = q[i]
+            self.images[i].set_data(values)
+            # np.NaN (never visited states) does not count for the colors
+            if np.isfinite(values).any():
+                self.images[i].set_clim(np.nanmin(values), np.nanmax(values))
+            for (y, x), text in np.ndenumerate(self.texts[i]):
+                text.set_text("{:.1f}".format(values[y,x]))
+
+        self.fig.canvas.draw_idle()
+        self.fig.canvas.flush_events()
+        self.episodes = 0
+        self.last_draw = time.perf_counter()
+
+    def close(self,q = None):
+        """
+        draws the last q-values if given, the window stays open
+        """
+        if q is not None:
+            self.draw(q)
+
+def renderProcess(snapshots,actions,shape,max_text,keep_open = False):
+    """
+    draws every snapshot from the queue until it gets None, then keeps the window open until it is closed if keep_open
+    """
+    import matplotlib.pyplot as plt
+
+    renderer = PolicyRenderer(actions, shape, max_text=max_text)
+    while True:
+        try:
+            q = snapshots.get(timeout=0.05)
+        except queue.Empty:
+            # keep the window responsive
+            renderer.fig.canvas.flush_events()
+            continue
+        if q is None:
+            break
+        renderer.draw(q)
+
+    if keep_open:
+        plt.ioff()
+        plt.show()
+    plt.close(renderer.fig)
+
+class ProcessRenderer:
+    """
+    Same as PolicyRenderer, but the drawing happens in a separate process fed with copies of q
+
+    The training only copies q when a redraw is due. If the last snapshot is not drawn yet, the new one
+    is dropped, so the training never waits for the window.
+    By default the drawing process is a daemon: close draws the last snapshot, waits at most timeout seconds
+    for the process and the window closes, so a script can end. With keep_open = True the window stays open
+    after close and the python process only ends when the window is closed.
+
+    ### Attributes:
+        every (int > 0) : at most one snapshot every this many episodes
+        interval (float >= 0) : at least this many seconds between two snapshots
+        keep_open (bool) : if the window stays open after close
+        timeout (float >= 0) : seconds close waits for the drawing process
+        closed (bool) : if the drawing process was told to stop
+        snapshots (multiprocessing.Queue) : q-values on the way to the drawing process
+        process (multiprocessing.Process) : the drawing process
+    """
+
+    def __init__(self,actions,shape,every = 1,interval = 0.0,max_text = 400,keep_open = False,timeout = 5.0):
+        """
+        ### Arguments:
+            actions, shape, every, interval, max_text : same as PolicyRenderer
+            keep_open (bool) : if true the window stays open after close until the user closes it (the python process waits for it)
+            timeout (float >= 0) : seconds close waits for the drawing process to draw the last snapshot and end
+        """
+        self.every = every
+        self.interval = interval
+        self.episodes = every
+        self.last_draw = -np.inf
+        self.keep_open = keep_open
+        self.timeout = timeout
+
+        self.closed = False
+        self.snapshots = multiprocessing.Queue(maxsize=1)
+        self.process = multiprocessing.Process(target=renderProcess, args=(self.snapshots, list(actions), tuple(shape), max_text, keep_open),
+                                               daemon=not keep_open)
+        self.process.start()
+
+    def due(self):
+        """
+        counts one episode and returns whether a snapshot is allowed now
+        """
+        self.episodes += 1
+        return self.episodes >= self.every and time.perf_counter() - self.last_draw >= self.interval
+
+    def draw(self,q):
+        """
+        sends a copy of the q-values (np.array(shape(len(action) , y , x))) to the drawing process
+        """
+        if self.closed:
+            return
+        try:
+            # copy now, the queue pickles it later in another thread
+            self.snapshots.put_nowait(np.array(q, copy=True))
+        except queue.Full:
+            pass
+        self.episodes = 0
+        self.last_draw = time.perf_counter()
+
+    def close(self,q = None):
+        """
+        sends the last q-values and tells the drawing process that the training is over,
+        without keep_open it waits at most timeout seconds until the process ended
+        """
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            if q is not None:
+                self.snapshots.put(np.array(q, copy=True), timeout=self.timeout)
+            self.snapshots.put(None, timeout=self.timeout)
+        except queue.Full:
+            pass # the window was closed already
+        if not self.keep_open:
+            self.process.join(self.timeout)
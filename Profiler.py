@@ -0,0 +1,90 @@
+'''
+    File name: Profiler.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+from time import perf_counter
+
+class Profiler:
+    """
+    Cumulative time and amount of calls of the parts of an episode
+
+    Given to SARSAn (profiler = Profiler()), it measures the sections
+        episode : whole episode
+        step : Gridworld.step (environment)
+        policy : SARSAn.policy (action selection)
+        returns : n-step returns and the estimates after n steps
+        update : q updates
+        visualize : visualization of the grid and the policy
+        planning : model backups after each step (planning_steps > 0)
+        kernel : whole episodes of the compiled kernel
+    Without a profiler each section only costs one check for None.
+
+    ### Attributes:
+        times (dict) : section : seconds in the current episode
+        counts (dict) : section : calls in the current episode
+        run_times (dict) : section : seconds of all finished episodes
+        run_counts (dict) : section : calls of all finished episodes
+        episodes (list) : summary of each finished episode
+    """
+
+    def __init__(self):
+        self.times = {}
+        self.counts = {}
+        self.run_times = {}
+        self.run_counts = {}
+        self.episodes = []
+
+    def add(self,section,seconds):
+        """
+        adds one call of a section with its time
+        """
+        self.times[section] = self.times.get(section, 0.0) + seconds
+        self.counts[section] = self.counts.get(section, 0) + 1
+
+    def clock(self):
+        return perf_counter()
+
+    def endEpisode(self):
+        """
+        finishes the current episode: stores its summary and adds it to the run
+
+        ### return:
+            summary (dict) : section : {"seconds", "calls"} of the episode
+        """
+        summary = self.summary(self.times, self.counts)
+        self.episodes.append(summary)
+        for section, seconds in self.times.items():
+            self.run_times[section] = self.run_times.get(section, 0.0) + seconds
+            self.run_counts[section] = self.run_counts.get(section, 0) + self.counts[section]
+        self.times = {}
+        self.counts = {}
+        return summary
+
+    def runSummary(self):
+        """
+        ### return:
+            summary (dict) : section : {"seconds", "calls"} of all finished episodes
+        """
+        return self.summary(self.run_times, self.run_counts)
+
+    def summary(self,times,counts):
+        return {section : {"seconds" : times[section], "calls" : counts[section]} for section in times}
+
+    def report(self,summary = None):
+        """
+        ### return:
+            text (str) : table of a summary (the run if None) with the time per call and the share of the episode time
+        """
+        summary = self.runSummary() if summary is None else summary
+        total = summary["episode"]["seconds"] if "episode" in summary else sum(value["seconds"] for value in summary.values())
+
+        lines = [("section".ljust(10) + "seconds".rjust(12) + "calls".rjust(12) + "us/call".rjust(12) + "share".rjust(8))]
+        for section, value in sorted(summary.items(), key = lambda item: -item[1]["seconds"]):
+            per_call = 1e6 * value["seconds"] / max(value["calls"], 1)
+            share = value["seconds"] / total if total > 0 else 0.0
+            lines.append(section.ljust(10) + format(value["seconds"], "12.4f") + format(value["calls"], "12d") + format(per_call, "12.2f") + format(share, "8.1%"))
+        return "\n".join(lines)
@@ -0,0 +1,100 @@
+'''
+    File name: QTable.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+
+class ChunkedQTable:
+    """
+    Q-values that are only allocated for the parts of the gridworld the agent visits
+
+    The gridworld is split into square chunks of chunk_size * chunk_size fields. A chunk is allocated
+    and initialized with normal noise (like the dense q of SARSAn) the first time one of its states is
+    read or written. Indexing works like the dense array for single states: q[action,y,x] and q[:,y,x].
+
+    ### Attributes:
+        shape (tuple) : (len(action), y, x) like the dense q
+        chunk_size (int>0) : length of the side of a chunk
+        scale (float>=0) : standard deviation of the initial q-values
+        generator (numpy.random.Generator) : random numbers for the initialization
+        chunks (dict) : (y // chunk_size, x // chunk_size) : np.array(shape(len(action), chunk_size, chunk_size))
+    """
+
+    def __init__(self,shape,chunk_size = 32,scale = 0.2,rng = None):
+        """
+        ### Arguments:
+            shape (tuple) : (len(action), y, x) like the dense q
+            chunk_size (int>0) : length of the side of a chunk
+            scale (float>=0) : standard deviation of the initial q-values
+            rng (numpy.random.Generator, int or None) : generator or seed for the initialization
+        """
+        self.shape = tuple(shape)
+        self.chunk_size = chunk_size
+        self.scale = scale
+        self.generator = np.random.default_rng(rng)
+        self.chunks = {}
+
+    def getChunk(self,y,x):
+        """
+        returns the chunk of state [y,x] and allocates it if it is the first visit
+        """
+        key = (y // self.chunk_size, x // self.chunk_size)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            # chunks at the border only cover the part inside the gridworld
+            height = min(self.chunk_size, self.shape[1] - key[0] * self.chunk_size)
+            width = min(self.chunk_size, self.shape[2] - key[1] * self.chunk_size)
+            chunk = self.generator.normal(size=(self.shape[0],height,width),scale=self.scale)
+            self.chunks[key] = chunk
+        return chunk
+
+    def __getitem__(self,index):
+        action, y, x = index
+        return self.getChunk(y,x)[action, y % self.chunk_size, x % self.chunk_size]
+
+    def __setitem__(self,index,value):
+        action, y, x = index
+        self.getChunk(y,x)[action, y % self.chunk_size, x % self.chunk_size] = value
+
+    @property
+    def nbytes(self):
+        """
+        memory of all allocated chunks in bytes
+        """
+        return sum(chunk.nbytes for chunk in self.chunks.values())
+
+    def memoryUsage(self):
+        """
+        ### return:
+            usage (dict) : allocated chunks, possible chunks, bytes allocated and bytes of the dense array
+        """
+        chunks_y = -(-self.shape[1] // self.chunk_size)
+        chunks_x = -(-self.shape[2] // self.chunk_size)
+        return {"chunks" : len(self.chunks), "total_chunks" : chunks_y * chunks_x,
+                "nbytes" : self.nbytes, "dense_nbytes" : int(np.prod(self.shape)) * np.dtype(float).itemsize}
+
+    def fromArray(self,q):
+        """
+        replaces all q-values by the dense array q, only chunks with visited states (not np.NaN) are allocated
+        """
+        self.chunks = {}
+        for y in range(0, self.shape[1], self.chunk_size):
+            for x in range(0, self.shape[2], self.chunk_size):
+                chunk = q[:, y:y+self.chunk_size, x:x+self.chunk_size]
+                if not np.isnan(chunk).all():
+                    self.chunks[(y // self.chunk_size, x // self.chunk_size)] = np.array(chunk, dtype=float)
+
+    def toArray(self,fill = np.nan):
+        """
+        ### return:
+            q (np.array(shape)) : dense copy, fill for the states that were never visited
+        """
+        q = np.full(self.shape, fill)
+        for (chunk_y, chunk_x), chunk in self.chunks.items():
+            y, x = chunk_y * self.chunk_size, chunk_x * self.chunk_size
+            q[:, y:y+chunk.shape[1], x:x+chunk.shape[2]] = chunk
+        return q
@@ -0,0 +1,65 @@
+'''
+    File name: Rng.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+
+class RandomStream:
+    """
+    Gives single random numbers from blocks drawn in advance from a numpy.random.Generator
+
+    Drawing one scalar from numpy costs about as much as drawing a whole block, so the exploration
+    and slip decisions of one step are taken from blocks of block_size numbers.
+    The same seed gives the same sequence of numbers.
+
+    ### Attributes:
+        generator (numpy.random.Generator) : source of all random numbers
+        block_size (int > 0) : amount of numbers drawn at once
+        n_actions (int > 0) : random actions are in range(n_actions)
+    """
+
+    def __init__(self,rng = None,block_size = 4096,n_actions = 4):
+        """
+        ### Arguments:
+            rng (numpy.random.Generator, int or None) : generator or seed for a new one, None for a random seed
+            block_size (int > 0) : amount of numbers drawn at once
+            n_actions (int > 0) : random actions are in range(n_actions)
+        """
+
+        self.generator = np.random.default_rng(rng)
+        self.block_size = block_size
+        self.n_actions = n_actions
+
+        # empty blocks, they are drawn when the first number is needed
+        self.uniforms = []
+        self.uniform_index = 0
+        self.actions = []
+        self.action_index = 0
+
+    def random(self):
+        """
+        ### return:
+            value (float) : uniform in [0,1)
+        """
+        if self.uniform_index == len(self.uniforms):
+            self.uniforms = self.generator.random(self.block_size).tolist()
+            self.uniform_index = 0
+        value = self.uniforms[self.uniform_index]
+        self.uniform_index += 1
+        return value
+
+    def action(self):
+        """
+        ### return:
+            action_index (int) : uniform in range(n_actions)
+        """
+        if self.action_index == len(self.actions):
+            self.actions = self.generator.integers(self.n_actions, size = self.block_size).tolist()
+            self.action_index = 0
+        value = self.actions[self.action_index]
+        self.action_index += 1
+        return value
@@ -0,0 +1,132 @@
+'''
+    File name: SARSALambda.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import SARSAn
+import Buffers
+
+class SARSALambda(SARSAn.SARSAn):
+    """
+    Implements Tabular SARSA(lambda) with eligibility traces to solve the Gridworld
+
+    Instead of the n-step returns every step updates all state-actions with an active trace by the
+    TD error of this step. Traces decay by gamma * lambda each step and are dropped below cutoff
+    (Buffers.TraceSet), so each step only touches the active ones and no trajectory is stored.
+    lambda = 0 is 1-step SARSA, lambda = 1 (with cutoff = 0) is like Monte Carlo.
+    Everything else (policy, start, train, checkpoints, visualization) is the same as in SARSAn, but there is
+    no compiled episode, chunked q storage, planning or flat_states gridworld.
+
+    ### Attributes:
+        lam (0<= float <= 1) = lambda, decay of the traces
+        replacing (bool) = if true replacing traces, else accumulating traces
+        cutoff (float >= 0) = traces below cutoff are dropped
+        traces (Buffers.TraceSet) = active traces of the current episode
+    """
+
+    def __init__(self,gridworld,lam = 0.9,traces = "accumulating",cutoff = 1e-4,**kwargs):
+        """
+        ### Arguments:
+            gridworld = Gridworld objekt : the environment, we are going to learn
+            lam (0<= float <= 1) = lambda, decay of the traces
+            traces (str) = "accumulating" (the trace of a state-action grows by 1 each visit) or "replacing" (it is set to 1)
+            cutoff (float >= 0) = traces below cutoff are dropped
+            kwargs = the other arguments of SARSAn.SARSAn except n, compiled = True, q_storage = "chunked", planning_steps > 0 and flat_states are not possible
+        """
+
+        if traces not in ("accumulating", "replacing"):
+            raise ValueError("traces has to be 'accumulating' or 'replacing', not " + repr(traces))
+        if (kwargs.get("compiled", False) or kwargs.get("q_storage", "dense") != "dense" or kwargs.get("planning_steps", 0) > 0
+                or gridworld.flat_states):
+            raise ValueError("SARSALambda needs compiled = False, q_storage = 'dense', planning_steps = 0 and a gridworld without flat_states")
+
+        super().__init__(gridworld, n=1, **kwargs)
+
+        self.lam = lam
+        self.replacing = traces == "replacing"
+        self.cutoff = cutoff
+        self.traces = Buffers.TraceSet(self.q.shape)
+
+    def episode(self,e = "manually"):
+        """ creates one episode of the SARSA(lambda) algorithm
+
+        ### Attributes:
+            e = When using the Start method, to print which episode we are in
+        """
+
+        profiler = self.profiler
+        if profiler is not None:
+            episode_start = profiler.clock()
+
+        q = self.q
+        traces = self.traces
+        traces.reset()
+        decay = self.gamma * self.lam
+
+        state = self.gridworld.reset() # [y,x]
+        action = self.policy(state)
+
+        # for calculating average return
+        steps = 0
+        returns = 0
+
+        # print Gridworld and episode
+        if self.visualize_grid:
+            self.gridworld.visualize("Epsiode: " + str(e))
+
+        at_terminal = False
+        while(not at_terminal):
+
+            # make step and observe newState and reward, select next action
+            next_state, r, at_terminal = self.gridworld.step(action)
+            next_action = self.policy(next_state)
+            returns += r
+            steps += 1
+
+            # print Gridworld and episode
+            if self.visualize_grid:
+                if profiler is not None:
+                    start = profiler.clock()
+                self.gridworld.visualize("Epsiode: " + str(e))
+                if profiler is not None:
+                    profiler.add("visualize", profiler.clock() - start)
+
+            if profiler is not None:
+                start = profiler.clock()
+
+            # TD error, the terminal state has no future
+            future_estimate = 0 if at_terminal else self.gamma * q[next_action,next_state[0],next_state[1]]
+            delta = r + future_estimate - q[action,state[0],state[1]]
+
+            if profiler is not None:
+                middle = profiler.clock()
+                profiler.add("returns", middle - start)
+
+            # improve policy for all state-actions with an active trace
+            traces.visit(action, state, self.replacing)
+            actions, ys, xs, values = traces.active()
+            q[actions, ys, xs] += self.alpha * delta * values
+            traces.decay(decay, self.cutoff)
+
+            if profiler is not None:
+                profiler.add("update", profiler.clock() - middle)
+
+            state, action = next_state, next_action
+
+        # end of one episode
+        if not self.headless:
+            print("Epsiode:",e)
+
+        self.gridworld.reset()
+
+        if self.visualize_policy and self.renderer.due():
+            self.visualize()
+
+        if profiler is not None:
+            profiler.add("episode", profiler.clock() - episode_start)
+            profiler.endEpisode()
+
+        return returns / steps, returns, steps
@@ -2,14 +2,19 @@
     File name: SARSAn.py   
     Author: Eosandra Grund   
     Date created: 23.04.2022   
-    Date last modified: 20.07.2022   
+    Date last modified: 18.10.2026   
     Python Version: 3.10.4  
 '''
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.pylab as pylab
 import Grid
+import Buffers
+import Rng
+import QTable
+import Checkpoint
+import Evaluation
+import ConsoleView
+import Planning
 
 # with pseudocode from book
 class SARSAn:
@@ -18,32 +23,63 @@ class SARSAn:
 
     Policy: epsilon-greedy policy   
 
-    remove visualizations for better performance   
+    remove visualizations for better performance (headless = True removes all of them)   
 
     ### Attributes:    
         gridworld = Gridworld objekt : the environment, we are going to learn   
         n (int > 0) : amounts of steps   
         epsilon (0<= float <= 1) = for the epsilon-greedy policy   
         decreasing_epsilon (bool) = if true decreasing epsilon after each episode, so we do more exploration at the beginning and more exploitation at the end   
+        epsilon_decay_episodes (int > 0 or None) = with decreasing_epsilon, epsilon -= epsilon / epsilon_decay_episodes after each episode, None for the episodes of start   
         gammma (0<= float <= 1) = discount for future rewards    
         alpha (0<= float <= 1) = stepsize (learning rate)   
         visualize_policy (bool) = if the policy should be visualized after each episode with pyplot   
+        renderer (PolicyView.PolicyRenderer or PolicyView.ProcessRenderer) = draws the policy if visualize_policy   
         visualize_grid (bool) = if the grid should be visualized after each step     
-        q (np.array(shape(len(action) , y , x))) = the q-values (state-action values)   
+        headless (bool) = if true nothing is visualized or printed and matplotlib is not imported   
+        callback (callable) = gets a dictionary with the statistics of each episode in start   
+        random (Rng.RandomStream) = random numbers for the policy and the initialization of q   
+        compiled (bool) = if whole episodes are run by Kernel.runEpisode on the tables of the gridworld   
+        q_storage (str) = "dense" or "chunked" (QTable.ChunkedQTable, only allocated where the agent goes)   
+        profiler (Profiler.Profiler) = measures the time of the parts of each episode if not None   
+        planning_steps (int >= 0) = backups with the learned model after each step   
+        planner (Planning.PrioritizedSweeping) = model of the gridworld for the backups, None if planning_steps == 0   
+        flat_states (bool) = if the gridworld has flat_states, then the states are indices y*x_dim+x and q is stored by state   
+        qIndex (callable) = (state, action) -> index of its q-value in q, for the layout of q   
+        qValues (callable) = state -> q-values of all actions in the state   
+        isTerminal (callable) = state -> if it is the terminal state   
+        toGridState (callable) = state -> [y,x] state, e.g. for the planner   
+        q (np.array(shape(len(action) , y , x))) = the q-values (state-action values), np.array(shape(y*x , len(action))) with flat_states, getQ gives both as (len(action) , y , x)   
 
     """
     
-    def __init__(self,gridworld,n=10,epsilon=0.5,decreasing_epsilon = False,gamma = 0.99,alpha = 0.3,visualize_policy = False,visualize_grid = True):
+    def __init__(self,gridworld,n=10,epsilon=0.5,decreasing_epsilon = False,epsilon_decay_episodes = None,gamma = 0.99,alpha = 0.3,visualize_policy = False,visualize_grid = True,headless = False,callback = None,rng = None,compiled = False,q_storage = "dense",chunk_size = 32,initial_q = None,profiler = None,visualize_every = 1,visualize_interval = 0.0,visualize_process = False,visualize_fps = None,visualize_keep_open = False,planning_steps = 0,planning_threshold = 1e-4):
         """
         ### Arguments:   
-            gridworld = Gridworld objekt : the environment, we are going to learn   
+            gridworld = Gridworld objekt : the environment, we are going to learn, with flat_states = True the agent uses state indices and q by state too   
             n (int > 0) : amounts of steps   
             epsilon (0<= float <= 1) = for the epsilon-greedy policy   
             decreasing_epsilon (bool) = if true decreasing epsilon after each episode, so we do more exploration at the beginning and more exploitation at the end   
+            epsilon_decay_episodes (int > 0 or None) = with decreasing_epsilon, the decrease after each episode is epsilon / epsilon_decay_episodes, so it does not depend on the amount of episodes, e.g. if a Convergence.ConvergenceMonitor may stop the learning early, None for the amount of episodes of start   
             gammma (0<= float <= 1) = discount for future rewards   
             alpha (0<= float <= 1) = stepsize (learning rate)   
             visualize_policy (bool) = if the policy should be visualized after each episode with pyplot   
             visualize_grid (bool) = if the grid should be visualized after each step   
+            headless (bool) = if true nothing is visualized or printed and matplotlib is not imported, overrides visualize_policy and visualize_grid   
+            callback (callable) = gets a dictionary with the keys episode, average_return, return, steps and epsilon after each episode in start, e.g. Metrics.MetricsCollector   
+            rng (numpy.random.Generator, int or None) = generator or seed for the policy and the initialization of q, None for a random seed   
+            compiled (bool) = if true whole episodes are run by Kernel.runEpisode (compiled with numba if it is installed), visualize_grid is ignored then   
+            q_storage (str) = "dense" for one array with all q-values, "chunked" for a QTable.ChunkedQTable that allocates the q-values only for the chunks of the gridworld the agent visits (for very large gridworlds)   
+            chunk_size (int > 0) = length of the side of the chunks for q_storage = "chunked"   
+            initial_q (np.array(shape(len(action) , y , x))) = start with these q-values instead of random ones, e.g. from DynamicProgramming.valueIteration   
+            profiler (Profiler.Profiler) = if given, the time and calls of the parts of each episode are measured (also Gridworld.step), see Profiler   
+            visualize_every (int > 0) = redraw the policy at most every visualize_every episodes   
+            visualize_interval (float >= 0) = at least visualize_interval seconds between two redraws of the policy   
+            visualize_process (bool) = if true the policy is drawn in a separate process from copies of q, so the training does not wait for the window   
+            visualize_fps (float > 0 or None) = show the grid at most visualize_fps times per second, None for every step   
+            visualize_keep_open (bool) = with visualize_process, if the policy window stays open after start until it is closed (python only ends then), otherwise it closes at the end   
+            planning_steps (int >= 0) = if > 0, the steps are stored in a model of the gridworld and after each step planning_steps backups with this model are done, the ones with the largest TD errors first (Dyna with prioritized sweeping, see Planning), not with compiled = True   
+            planning_threshold (float >= 0) = only state-actions with a TD error larger than this are planned   
         """
         
         self.gridworld = gridworld
@@ -51,47 +87,115 @@ class SARSAn:
         self.epsilon = epsilon # e-greedy policy, with decreasing epsilon
         self.gamma = gamma # discount for future rewards
         self.alpha = alpha # step size (learning rate)
-        self.visualize_policy = visualize_policy # because learning is slow when visualized
-        self.visualize_grid = visualize_grid
+        self.headless = headless # for batch jobs without any output
+        self.visualize_policy = visualize_policy and not headless # because learning is slow when visualized
+        self.visualize_grid = visualize_grid and not headless
         self.decreasing_epsilon = decreasing_epsilon
+        self.epsilon_decay_episodes = epsilon_decay_episodes
+        self.callback = callback
+        self.random = Rng.RandomStream(rng, n_actions=len(self.gridworld.getActions()))
+        self.compiled = compiled
+        self.q_storage = q_storage
+        self.profiler = profiler
+        self.gridworld.profiler = profiler
+        self.flat_states = gridworld.flat_states
+
+        if q_storage not in ("dense", "chunked"):
+            raise ValueError("q_storage has to be 'dense' or 'chunked', not " + repr(q_storage))
+        if compiled and q_storage != "dense":
+            raise ValueError("compiled needs q_storage = 'dense'")
+        if compiled and planning_steps > 0:
+            raise ValueError("planning_steps is not possible with compiled = True")
+        if epsilon_decay_episodes is not None and epsilon_decay_episodes < 1:
+            raise ValueError("epsilon_decay_episodes has to be at least 1 or None, not " + str(epsilon_decay_episodes))
+        if self.flat_states and q_storage != "dense":
+            raise ValueError("a gridworld with flat_states needs q_storage = 'dense'")
+
+        # trajectory and rolling n-step return, reused in every episode
+        self.trajectory = Buffers.TrajectoryBuffer(self.n, flat=self.flat_states)
+        self.discounted_return = Buffers.DiscountedReturn(self.gamma, self.n)
         
+        # model for planning between the steps
+        self.planning_steps = planning_steps
+        self.planner = None
+        if planning_steps > 0:
+            shape = (len(self.gridworld.getActions()),self.gridworld.getYdim(),self.gridworld.getXdim())
+            self.planner = Planning.PrioritizedSweeping(shape, self.gamma, self.alpha, planning_threshold)
+
         # take values from gridworld
         
         # initialize policy q : len(action) * y * x
-        self.q = np.random.normal(size=(len(self.gridworld.getActions()),self.gridworld.getYdim(),self.gridworld.getXdim()),scale=0.2)
+        shape = (len(self.gridworld.getActions()),self.gridworld.getYdim(),self.gridworld.getXdim())
+        if q_storage == "chunked":
+            self.q = QTable.ChunkedQTable(shape, chunk_size=chunk_size, scale=0.2, rng=self.random.generator)
+        else:
+            self.q = self.random.generator.normal(size=shape,scale=0.2)
 
-        # make terminal state 0
+        if self.flat_states:
+            # y*x * len(action), the q-values of a state are next to each other (same random values as the other layout)
+            self.q = np.ascontiguousarray(self.q.reshape(shape[0], -1).T)
+
+        # how a state is used in q, chosen once so episode and policy work for both layouts
         terminal = self.gridworld.getTerminal()
-        self.q[:,terminal[0],terminal[1]] = [0,0,0,0] # [y,x] here
+        if self.flat_states:
+            terminal_index = self.gridworld.terminal_index
+            self.qIndex = lambda state, action: (state, action)
+            self.qValues = lambda state: self.q[state]
+            self.isTerminal = lambda state: state == terminal_index
+            self.toGridState = self.gridworld.toState
+        else:
+            self.qIndex = lambda state, action: (action, state[0], state[1])
+            self.qValues = lambda state: self.q[:, state[0], state[1]]
+            self.isTerminal = lambda state: state[0] == terminal[0] and state[1] == terminal[1]
+            self.toGridState = lambda state: state
+
+        # make terminal state 0
+        if self.flat_states:
+            self.q[terminal_index] = 0
+        else:
+            self.q[:,terminal[0],terminal[1]] = [0,0,0,0] # [y,x] here
+
+        # warm start
+        if initial_q is not None:
+            self.setQ(initial_q)
         
         # prepare for visualization
+        if self.visualize_grid:
+            # new board, something else may have been printed since the last one
+            self.gridworld.console = ConsoleView.ConsoleRenderer(self.gridworld.world, max_fps=visualize_fps)
+
         if self.visualize_policy:
-            # go in interactive mode  
-            plt.ion() 
-            # show visualizatin without blocking the caluclations
-            plt.show(block=False)
-
-            self.fig, self.axes = plt.subplots(3,3, num ='SARSAn State')
-            for ax in self.axes.flat:
-                ax.axis('off')
+            import PolicyView
+
+            if visualize_process:
+                self.renderer = PolicyView.ProcessRenderer(self.gridworld.getActions(), shape[1:], every=visualize_every, interval=visualize_interval,
+                                                           keep_open=visualize_keep_open)
+            else:
+                self.renderer = PolicyView.PolicyRenderer(self.gridworld.getActions(), shape[1:], every=visualize_every, interval=visualize_interval)
             self.visualize()
              
     def policy(self,state):
         """ gives back an action according to the given state and current policy   
 
         ### Attributes: 
-            state [x,y] = starting state   
+            state [x,y] = starting state (index y*x_dim+x with flat_states)   
         ### return:    
             action_index (int 0- len(action)) = index of action   
         """
+
+        profiler = self.profiler
+        if profiler is not None:
+            start = profiler.clock()
         
         # calculate best action after policy
-        action_index = np.argmax(self.q[:,state[0],state[1]])
+        action_index = np.argmax(self.qValues(state))
         
         # check whether greedy or random
-        greedy = np.random.choice([True,False],p=[1-self.epsilon, self.epsilon])
-        if not greedy: # get random action
-            action_index = np.random.choice(range(len(self.gridworld.getActions())))
+        if self.random.random() < self.epsilon: # get random action
+            action_index = self.random.action()
+
+        if profiler is not None:
+            profiler.add("policy", profiler.clock() - start)
         return action_index
         
     def episode(self,e = "manually"):
@@ -100,14 +204,24 @@ class SARSAn:
         ### Attributes:     
             e = When using the Start method, to print which episode we are in   
         """
+
+        if self.compiled:
+            return self.compiledEpisode(e)
+
+        profiler = self.profiler
+        if profiler is not None:
+            episode_start = profiler.clock()
         
-        # reset the environment gridworld and initialize states array
-        state = np.array([self.gridworld.reset()],dtype=int) # [[y,x],[y,x],...]
-        
-        # initialize n, a (actions trajectory) and reward (reward trajectory)
+        # reset the environment gridworld and initialize the trajectory with states and actions
         n = self.n # n-step SARSA
-        action = np.array([self.policy(state[0])], dtype=int)
-        reward = np.empty(shape=(0), dtype=int)
+        trajectory = self.trajectory
+        trajectory.reset()
+        start_state = self.gridworld.reset() # [y,x] or index
+        trajectory.append(start_state, self.policy(start_state))
+
+        # and the rewards for the n-step returns
+        discounted_return = self.discounted_return
+        discounted_return.reset()
         
         t = 0 # in which step the agent is
         t_update = 0 # where we are updating the policy, because always behind t (tau in formula)
@@ -119,129 +233,310 @@ class SARSAn:
         
         # print Gridworld and episode
         if self.visualize_grid:
-            self.gridworld.visualize()
-            print("Epsiode:",e)        
+            self.gridworld.visualize("Epsiode: " + str(e))
         
         at_terminal = False                       
         while(not at_terminal):
                             
             # make step and observe newState and reward
-            s, r, at_terminal = self.gridworld.step(action[t])     
+            s, r, at_terminal = self.gridworld.step(trajectory.getAction(t))     
             returns += r       
             steps+=1 # one step done
-            # selection next action
-            action = np.append(action,[self.policy(s)],axis=0)
             
-            # remember state and reward for later policy updates
-            state = np.append(state,[s],axis=0) # state[t+1]
-            reward = np.append(reward,[r],axis=0) # reward[t]
+            # selection next action and remember state, action and reward for later policy updates
+            trajectory.append(s, self.policy(s)) # state[t+1], action[t+1]
+            discounted_return.append(r) # reward[t]
 
             # print Gridworld and episode
             if self.visualize_grid:
-                self.gridworld.visualize()
-                print("Epsiode:",e)        
+                if profiler is not None:
+                    start = profiler.clock()
+                self.gridworld.visualize("Epsiode: " + str(e))
+                if profiler is not None:
+                    profiler.add("visualize", profiler.clock() - start)
             
             if at_terminal:
                 terminal_state_index = t+1
+                discounted_return.finish()
             
             #t += 1 # already next so t_update + n = t + 1
             # update the estimates
-
-            visited_states = [] # here enough because only for MC
-
             while at_terminal or t_update + n <= t :
 
                 # we do not want to update the terminal state
-                if np.mean(np.equal(state[t_update],np.array(self.gridworld.getTerminal()))) == 1:
+                state = trajectory.getState(t_update) # [y,x] or index
+                if self.isTerminal(state):
                     break
-                
-                
-                # implement first visited check for Monte Carlo (Is this the first time we are here in this episode)
-                if(n == np.inf):
-                    for visited_state in visited_states:
-                        if np.mean(np.equal(state[t_update],visited_state)) == 1:
-                            break
-                visited_states.append(state[t_update])
+                action = trajectory.getAction(t_update)
+
+                if profiler is not None:
+                    start = profiler.clock()
 
                 # calcualte value for n steps or until the terminal if found
-                mc_estimate = np.sum([self.gamma**(i-t_update) * reward[i] for i in range(t_update,min(t_update+n,terminal_state_index))])
+                mc_estimate = discounted_return.pop()
                 future_estimate = 0
 
                 if t_update+n < terminal_state_index: # if we are not yet at the terminals state
                     # calculate the estimate after n
-                    future_estimate =  self.gamma**n * self.q[action[t_update+n],state[t_update+n][0],state[t_update+n][1]] # y,x
+                    future_estimate =  discounted_return.powers[n] * self.q[self.qIndex(trajectory.getState(t_update+n),trajectory.getAction(t_update+n))]
 
                 estimate = mc_estimate + future_estimate
+
+                if profiler is not None:
+                    middle = profiler.clock()
+                    profiler.add("returns", middle - start)
                     
                 # improve policy
-                self.q[action[t_update],state[t_update][0],state[t_update][1]] += self.alpha * (estimate - self.q[action[t_update],state[t_update][0],state[t_update][1]] )               
+                index = self.qIndex(state, action)
+                self.q[index] += self.alpha * (estimate - self.q[index])               
+
+                if profiler is not None:
+                    profiler.add("update", profiler.clock() - middle)
             
                 t_update += 1                                 
+
+            # simulated steps with the model
+            if self.planner is not None:
+                if profiler is not None:
+                    start = profiler.clock()
+                # the planner works on the [action, y, x] layout of q
+                planning_q = self.getQ() if self.flat_states else self.q
+                self.planner.epsilon = self.epsilon
+                self.planner.observe(planning_q, self.toGridState(trajectory.getState(t)), trajectory.getAction(t), r, self.toGridState(s), at_terminal)
+                self.planner.plan(planning_q, self.planning_steps)
+                if profiler is not None:
+                    profiler.add("planning", profiler.clock() - start)
                 
             t += 1
 
         # end of one episode
-        print("Epsiode:",e)  
+        if not self.headless:
+            print("Epsiode:",e)  
 
         self.gridworld.reset()
         
-        if self.visualize_policy:
+        if self.visualize_policy and self.renderer.due():
+            if profiler is not None:
+                start = profiler.clock()
             self.visualize()  
+            if profiler is not None:
+                profiler.add("visualize", profiler.clock() - start)
+
+        if profiler is not None:
+            profiler.add("episode", profiler.clock() - episode_start)
+            profiler.endEpisode()
 
         average_return = returns / steps
         
         return average_return, returns, steps
             
         
+    def compiledEpisode(self,e = "manually"):
+        """ creates one episode of the n-Step SARSA algorithm with Kernel.runEpisode   
+
+        ### Attributes:     
+            e = When using the Start method, to print which episode we are in   
+        """
+
+        import Kernel # numba takes long to import, so only when it is used
+
+        gridworld = self.gridworld
+        gridworld.reset()
+        start = gridworld.initial_index
+        terminal = gridworld.terminal_index
+        n = -1 if self.n == np.inf else int(self.n)
+
+        profiler = self.profiler
+        if profiler is not None:
+            episode_start = profiler.clock()
+
+        # the view has the layout [action, y*x_dim+x], so the kernel updates self.q
+        q = self.q.T if self.flat_states else self.q.reshape(self.q.shape[0], -1)
+        returns, steps = Kernel.runEpisode(q, gridworld.next_state, gridworld.reward, start, terminal, n,
+                                           self.gamma, self.alpha, self.epsilon, gridworld.epsilon, self.random.generator)
+
+        if profiler is not None:
+            profiler.add("kernel", profiler.clock() - episode_start)
+
+        # end of one episode
+        if not self.headless:
+            print("Epsiode:",e)  
+
+        if self.visualize_policy and self.renderer.due():
+            self.visualize()  
+
+        if profiler is not None:
+            profiler.add("episode", profiler.clock() - episode_start)
+            profiler.endEpisode()
+
+        return returns / steps, returns, steps
+
+    def getQ(self):
+        """ returns all q-values as np.array(shape(len(action) , y , x)), np.NaN for never visited states with q_storage = "chunked"   
+        with flat_states it is a view of q with this layout (changes go to q), e.g. for showing or saving it """
+        if self.q_storage == "chunked":
+            return self.q.toArray()
+        if self.flat_states:
+            return self.q.T.reshape(self.q.shape[1], self.gridworld.getYdim(), self.gridworld.getXdim())
+        return self.q
+
+    def setQ(self,q):
+        """ replaces all q-values by q (np.array(shape(len(action) , y , x))) """
+        own = self.getQ() if self.flat_states else self.q
+        if np.shape(q) != own.shape:
+            raise ValueError("q-values of shape " + str(np.shape(q)) + " do not fit the agent with " + str(own.shape))
+
+        if self.q_storage == "chunked":
+            self.q.fromArray(q)
+        else:
+            own[...] = q # the same array, views of it stay valid
+
+    def qMemory(self):
+        """ returns the memory of the q-values in bytes """
+        return self.q.nbytes
+
+    def greedyPolicy(self):
+        """ returns the best action of every state as np.array(shape(y , x)), without exploration """
+        return Evaluation.greedyPolicy(self.getQ())
+
+    def evaluate(self,rollouts = 1000,max_steps = 1000,rng = None):
+        """ runs the greedy policy without learning in rollouts episodes at once, see Evaluation.evaluatePolicy   
+
+        ### Arguments:   
+            rollouts (int > 0) = amount of episodes   
+            max_steps (int > 0) = episodes are stopped after max_steps steps   
+            rng (numpy.random.Generator, int or None) = generator or seed for the state transition function   
+
+        ### return:   
+            results (dict) = mean_return, std_return, success_rate, mean_steps, steps_percentiles, returns, steps and success   
+        """
+        return Evaluation.evaluatePolicy(self.gridworld, self.greedyPolicy(), rollouts=rollouts, max_steps=max_steps, rng=rng)
+
+    def saveCheckpoint(self,path,episode = 0,average_return = None,returns = None,steps = None):
+        """ saves q, epsilon and the statistics of the episodes done in the directory path, see Checkpoint.save   
+
+        ### Arguments:   
+            path (str) = directory of the checkpoint   
+            episode (int) = amount of episodes done   
+            average_return, returns, steps (np.array) = statistics of the episodes done, as returned by start   
+        """
+        empty = np.zeros(0)
+        Checkpoint.save(path, self.getQ(), self.epsilon, episode,
+                        empty if average_return is None else average_return,
+                        empty if returns is None else returns,
+                        empty if steps is None else steps)
+
+    def loadCheckpoint(self,path):
+        """ continues from a checkpoint: loads q and epsilon   
+
+        ### return:   
+            checkpoint (dict) = everything in the checkpoint, see Checkpoint.load   
+        """
+        checkpoint = Checkpoint.load(path)
+        self.setQ(checkpoint["q"])
+        self.epsilon = checkpoint["epsilon"]
+        return checkpoint
+
     def visualize(self):
-        """ visualizes the current policy """
-            
-        for i, action in enumerate(self.gridworld.getActions()):
-            ax = self.axes.flat[2*i + 1]
-            ax.cla() # add axis
-            ax.set(title = action)
-            ax.set_xticks(np.arange(self.gridworld.getXdim()))
-            ax.set_yticks(np.arange(self.gridworld.getYdim()))
-            ax.imshow(self.q[i,:,:], interpolation='None')
-            for y in range(self.q.shape[1]): 
-                for x in range(self.q.shape[2]): 
-                    text = ax.text(x, y, "{:.1f}".format(self.q[i,y,x],1),
-                       ha="center", va="center", color="black", fontsize=8)
-                    plt.setp(text, path_effects=[
-        PathEffects.withStroke(linewidth=1, foreground="w")])
-
-        self.fig.suptitle("Policy ",fontsize=18)
-        plt.draw()
-        pylab.pause(1.e-6) # important, do not delete
+        """ visualizes the current policy (only with visualize_policy), see PolicyView """
+        self.renderer.draw(self.getQ())
        
-    def start(self,episodes=10,evaluation = True):
+    def train(self,episodes=10,first_episode = 0,monitor = None):
+        ''' Does the episodes first_episode+1 until episodes and yields the statistics of each episode as soon as it is done   
+
+        ### Arguments:    
+            episodes (int >=1 ) = the amount of episodes (decreasing epsilon should be 0 after them)     
+            first_episode (int >= 0) = the amount of episodes done before, e.g. in a checkpoint   
+            monitor (Convergence.ConvergenceMonitor) = if given, it is reset and the training stops after the episode in which it converged   
+
+        ### yield:   
+            record (dict) = episode, average_return, return, steps and epsilon (during the episode), also given to the callback   
+        '''
+
+        if monitor is not None:
+            monitor.reset()
+
+        for e in range(first_episode, episodes):
+            average_return, returns, steps = self.episode(e+1)
+            record = {"episode" : e+1, "average_return" : float(average_return), "return" : float(returns), "steps" : int(steps), "epsilon" : float(self.epsilon)}
+
+            if self.callback is not None:
+                self.callback(record)
+
+            # calculate new epsilon, should be 0 at the end
+            if self.decreasing_epsilon:
+                self.epsilon -= self.epsilon / (episodes if self.epsilon_decay_episodes is None else self.epsilon_decay_episodes)
+
+            converged = monitor is not None and monitor.update(self.getQ(), returns)
+            yield record
+            if converged:
+                return
+
+    def start(self,episodes=10,evaluation = True,checkpoint = None,checkpoint_every = 0,resume = False,monitor = None):
         ''' Starts the Learning Process and does episodes amounds of episodes   
 
         ### Arguments:    
             episodes (int >=1 ) = the amount of episodes to do     
-            evaluation (bool) = if you want a list and plot of the total return and steps per episodes at the end (only works if visualize_policy == False)   
+            evaluation (bool) = if you want a list and plot of the total return and steps per episodes at the end (only works if visualize_policy == False and headless == False)   
+            checkpoint (str) = directory for checkpoints, see saveCheckpoint   
+            checkpoint_every (int >= 0) = save a checkpoint every checkpoint_every episodes and at the end, 0 for never   
+            resume (bool) = if true and there is a checkpoint, continue with its q-values, epsilon and statistics after the episodes it has done (the random numbers are not part of the checkpoint)   
+            monitor (Convergence.ConvergenceMonitor) = if given, the learning stops as soon as it converged (monitor.reason says why), also before episodes, then decreasing epsilon is not 0 yet   
+
+        ### return:   
+            average_return (np.array(shape(episodes))) = average return per step of each episode (only the episodes done if the monitor stopped the learning)   
+            returns (np.array(shape(episodes))) = total return of each episode (float, rewards are not whole numbers)   
+            steps (np.array(shape(episodes))) = amount of steps of each episode   
         '''
 
         # to save values for each episode
-        average_return = np.array(range(episodes),dtype=np.float64)
-        returns = np.array(range(episodes))
-        steps = np.array(range(episodes))
+        average_return = np.zeros(episodes)
+        returns = np.zeros(episodes)
+        steps = np.zeros(episodes,dtype=int)
+
+        # continue after the episodes of the checkpoint
+        first_episode = 0
+        if resume and checkpoint is not None and Checkpoint.exists(checkpoint):
+            saved = self.loadCheckpoint(checkpoint)
+            first_episode = min(saved["episode"], episodes)
+            average_return[:first_episode] = saved["average_return"][:first_episode]
+            returns[:first_episode] = saved["returns"][:first_episode]
+            steps[:first_episode] = saved["steps"][:first_episode]
         
         # do the learning
-        for e in range(episodes):
-            average_return[e], returns[e], steps[e] = self.episode(e+1)
+        done = first_episode
+        for record in self.train(episodes, first_episode, monitor):
+            e = record["episode"] - 1
+            average_return[e], returns[e], steps[e] = record["average_return"], record["return"], record["steps"]
+            done = e+1
+            stopped = monitor is not None and monitor.converged
 
-            # calculate new epsilon, should be 0 at the end
-            if self.decreasing_epsilon:
-                self.epsilon -= self.epsilon / episodes
+            if checkpoint is not None and checkpoint_every > 0 and ((e+1) % checkpoint_every == 0 or e+1 == episodes or stopped):
+                self.saveCheckpoint(checkpoint, e+1, average_return, returns, steps)
+
+        # only the episodes done if the monitor stopped early
+        average_return, returns, steps = average_return[:done], returns[:done], steps[:done]
+        if monitor is not None and monitor.converged and not self.headless:
+            print("Converged after", done, "episodes:", monitor.reason)
+
+        # the last episodes may have been skipped by the throttling
+        if self.visualize_policy:
+            self.renderer.close(self.getQ())
 
         # visualizing only works if not visualize_poliy
-        if evaluation: 
+        if evaluation and not self.headless: 
+            import matplotlib.pyplot as plt
+
             # print statistic average return
-            for e in range(episodes):
+            for e in range(done):
                 print("Episode",("       " + str(e+1))[-7:],"; Average Return: ", (str(average_return[e]) + "                 ")[:10], "; Return: ", ("        " + str(returns[e]) )[-10:], "; Steps: ", ("        " + str(steps[e]) )[-10:])
 
             plt.plot(returns, label = "Total Returns")
             plt.plot(steps, label = "Steps")
             plt.legend()
-            plt.show()
\ No newline at end of file
+            plt.show()
+
+        if self.profiler is not None and not self.headless:
+            print(self.profiler.report())
+
+        return average_return, returns, steps
\ No newline at end of file
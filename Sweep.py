@@ -0,0 +1,120 @@
+'''
+    File name: Sweep.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import argparse
+import itertools
+import multiprocessing
+import numpy as np
+import Convergence
+import Grid
+import Gridworlds
+import SARSAn
+
+def parameterGrid(gridworlds = None, n = (1,10,np.inf), alpha = (0.3,), gamma = (0.99,), epsilon = (0.5,), decreasing_epsilon = (True,), seeds = 5):
+    """
+    creates one configuration for each combination of the hyperparameters and each seed
+
+    ### Arguments:
+        gridworlds (list) : indices in Gridworlds.Gridworlds.GRIDWORLD, all of them if None
+        n, alpha, gamma, epsilon, decreasing_epsilon (list) : values to try for the SARSAn arguments
+        seeds (int > 0) : amount of runs with different random numbers per combination
+
+    ### return:
+        configs (list) : dictionaries with the keys gridworld, n, alpha, gamma, epsilon, decreasing_epsilon and seed
+    """
+
+    if gridworlds is None:
+        gridworlds = range(len(Gridworlds.Gridworlds.GRIDWORLD))
+
+    keys = ["gridworld", "n", "alpha", "gamma", "epsilon", "decreasing_epsilon", "seed"]
+    values = [gridworlds, n, alpha, gamma, epsilon, decreasing_epsilon, range(seeds)]
+    return [dict(zip(keys, combination)) for combination in itertools.product(*values)]
+
+def runConfig(job):
+    """
+    trains one headless SARSAn agent, executed in the worker processes
+
+    ### Arguments:
+        job (tuple) : (config dictionary, episodes, np.random.SeedSequence of this run, arguments of Convergence.ConvergenceMonitor or None)
+
+    ### return:
+        average_return, returns, steps (np.array(shape(episodes done))) : the statistics of SARSAn.start
+    """
+
+    config, episodes, seed_sequence, convergence = job
+    monitor = None if convergence is None else Convergence.ConvergenceMonitor(**convergence)
+
+    # every run gets its own random numbers, independent of the worker it runs in
+    world_seed, player_seed = seed_sequence.spawn(2)
+
+    world = Grid.Gridworld(Gridworlds.Gridworlds.GRIDWORLD[config["gridworld"]], rng = world_seed)
+    player = SARSAn.SARSAn(gridworld = world, n = config["n"], epsilon = config["epsilon"], decreasing_epsilon = config["decreasing_epsilon"],
+                           gamma = config["gamma"], alpha = config["alpha"], headless = True, rng = player_seed)
+    return player.start(episodes = episodes, evaluation = False, monitor = monitor)
+
+def resultDtype(episodes):
+    """
+    dtype of the results table, one row per run with the statistics of each episode
+    """
+    return np.dtype([("gridworld", int), ("n", float), ("alpha", float), ("gamma", float), ("epsilon", float), ("decreasing_epsilon", bool), ("seed", int),
+                     ("episodes", int), ("average_return", float, (episodes,)), ("returns", float, (episodes,)), ("steps", int, (episodes,))])
+
+def runSweep(configs, episodes = 50, processes = None, seed = 0, convergence = None):
+    """
+    trains one agent per configuration on all cores
+
+    ### Arguments:
+        configs (list) : configurations, e.g. from parameterGrid
+        episodes (int >= 1) : amount of episodes per run
+        processes (int > 0) : amount of worker processes, all cores if None
+        seed (int) : root seed, the same seed gives the same results
+        convergence (dict) : arguments of Convergence.ConvergenceMonitor, if given each run stops when it converged, None to do all episodes
+
+    ### return:
+        results (np.array(dtype = resultDtype(episodes))) : one row per configuration in the order of configs,
+            episodes is the amount of episodes done, the returns after it are np.nan and the steps 0
+    """
+
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(configs))
+    jobs = [(config, episodes, seed_sequence, convergence) for config, seed_sequence in zip(configs, seed_sequences)]
+
+    with multiprocessing.Pool(processes = processes) as pool:
+        # imap keeps the order of the jobs, chunks keep the overhead small for short runs
+        chunksize = max(1, len(jobs) // (4 * (processes or multiprocessing.cpu_count())))
+        curves = list(pool.imap(runConfig, jobs, chunksize = chunksize))
+
+    results = np.zeros(len(configs), dtype = resultDtype(episodes))
+    for row, config, (average_return, returns, steps) in zip(results, configs, curves):
+        for key, value in config.items():
+            row[key] = value
+        done = len(steps)
+        row["episodes"] = done
+        row["average_return"] = np.nan
+        row["returns"] = np.nan
+        row["average_return"][:done] = average_return
+        row["returns"][:done] = returns
+        row["steps"][:done] = steps
+    return results
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description = "hyperparameter sweep of n-step SARSA over the gridworlds")
+    parser.add_argument("--episodes", type = int, default = 50)
+    parser.add_argument("--seeds", type = int, default = 5)
+    parser.add_argument("--processes", type = int, default = None)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--output", default = "sweep_results.npy")
+    parser.add_argument("--patience", type = int, default = 0, help = "stop each run when it was stable for this many episodes (Convergence.ConvergenceMonitor), 0 to do all episodes")
+    args = parser.parse_args()
+
+    configs = parameterGrid(seeds = args.seeds)
+    convergence = {"patience" : args.patience} if args.patience > 0 else None
+    results = runSweep(configs, episodes = args.episodes, processes = args.processes, seed = args.seed, convergence = convergence)
+    np.save(args.output, results)
+
+    print("saved", len(results), "runs in", args.output)
@@ -0,0 +1,103 @@
+'''
+    File name: Train.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import argparse
+import time
+import numpy as np
+import Grid
+import Gridworlds
+import SARSAn
+
+def parseArguments(arguments = None):
+    """
+    ### Arguments:
+        arguments (list) : command line arguments, None for sys.argv
+
+    ### return:
+        args (argparse.Namespace) : the parsed arguments, n is an int or np.inf
+    """
+
+    parser = argparse.ArgumentParser(description = "trains n-step SARSA on one of the gridworlds, headless unless --visualize is given")
+    parser.add_argument("--gridworld", type = int, default = 0, help = "index in Gridworlds.Gridworlds.GRIDWORLD")
+    parser.add_argument("--episodes", type = int, default = 50)
+    parser.add_argument("--n", type = float, default = 10, help = "amount of steps, inf for Monte Carlo")
+    parser.add_argument("--epsilon", type = float, default = 0.5)
+    parser.add_argument("--decreasing-epsilon", action = "store_true")
+    parser.add_argument("--epsilon-decay-episodes", type = int, default = None, help = "decrease epsilon by epsilon / this after each episode, instead of by epsilon / --episodes")
+    parser.add_argument("--gamma", type = float, default = 0.99)
+    parser.add_argument("--alpha", type = float, default = 0.3)
+    parser.add_argument("--seed", type = int, default = None, help = "seed for the gridworld and the agent, random if not given")
+    parser.add_argument("--compiled", action = "store_true", help = "run the episodes with Kernel.runEpisode")
+    parser.add_argument("--planning-steps", type = int, default = 0)
+    parser.add_argument("--flat-states", action = "store_true", help = "states as indices y*x_dim+x and q stored by state")
+    parser.add_argument("--patience", type = int, default = 0, help = "stop when the policy, q and the returns were stable for this many episodes (Convergence.ConvergenceMonitor), 0 to do all episodes")
+    parser.add_argument("--q-tolerance", type = float, default = 2.0, help = "largest max |delta q| of a stable episode")
+    parser.add_argument("--return-tolerance", type = float, default = 0.5, help = "largest change of the moving average return of a stable episode")
+    parser.add_argument("--log", default = None, help = "write the statistics of each episode to this .csv or .jsonl file")
+    parser.add_argument("--checkpoint", default = None, help = "directory for checkpoints")
+    parser.add_argument("--checkpoint-every", type = int, default = 0)
+    parser.add_argument("--resume", action = "store_true", help = "continue from the checkpoint")
+    parser.add_argument("--visualize", action = "store_true", help = "show the gridworld, the policy and the evaluation plot")
+    args = parser.parse_args(arguments)
+
+    if not 0 <= args.gridworld < len(Gridworlds.Gridworlds.GRIDWORLD):
+        parser.error("--gridworld has to be between 0 and " + str(len(Gridworlds.Gridworlds.GRIDWORLD) - 1) + ", not " + str(args.gridworld))
+    # n-step SARSA needs a whole amount of steps
+    if args.n != np.inf:
+        if not float(args.n).is_integer() or args.n < 1:
+            parser.error("--n has to be a positive integer or inf, not " + str(args.n))
+        args.n = int(args.n)
+    if args.epsilon_decay_episodes is not None and args.epsilon_decay_episodes < 1:
+        parser.error("--epsilon-decay-episodes has to be a positive integer")
+    return args
+
+def train(args):
+    """
+    creates the gridworld and the agent of the arguments and trains it
+
+    ### return:
+        average_return, returns, steps (np.array) : statistics of each episode, see SARSAn.start
+        monitor (Convergence.ConvergenceMonitor) : the monitor of --patience, None without it
+    """
+
+    seeds = np.random.SeedSequence(args.seed).spawn(2)
+    world = Grid.Gridworld(Gridworlds.Gridworlds.GRIDWORLD[args.gridworld], rng = np.random.default_rng(seeds[0]), flat_states = args.flat_states)
+
+    callback = None
+    if args.log is not None:
+        import Metrics
+        callback = Metrics.MetricsLog(args.log)
+
+    monitor = None
+    if args.patience > 0:
+        import Convergence
+        monitor = Convergence.ConvergenceMonitor(patience = args.patience, q_tolerance = args.q_tolerance, return_tolerance = args.return_tolerance)
+
+    player = SARSAn.SARSAn(gridworld = world, n = args.n, epsilon = args.epsilon, decreasing_epsilon = args.decreasing_epsilon,
+                           epsilon_decay_episodes = args.epsilon_decay_episodes,
+                           gamma = args.gamma, alpha = args.alpha, visualize_policy = args.visualize, visualize_grid = args.visualize,
+                           headless = not args.visualize, callback = callback, rng = np.random.default_rng(seeds[1]),
+                           compiled = args.compiled, planning_steps = args.planning_steps)
+    try:
+        return player.start(episodes = args.episodes, evaluation = args.visualize, checkpoint = args.checkpoint,
+                            checkpoint_every = args.checkpoint_every, resume = args.resume, monitor = monitor), monitor
+    finally:
+        if callback is not None:
+            callback.close()
+
+if __name__ == "__main__":
+
+    start = time.perf_counter()
+    args = parseArguments()
+    (average_return, returns, steps), monitor = train(args)
+
+    last = max(1, min(10, len(steps)))
+    print("gridworld", args.gridworld, ":", len(steps), "episodes,", int(steps.sum()), "steps in", format(time.perf_counter() - start, ".2f"), "s,",
+          "last", last, "episodes: mean return", format(returns[-last:].mean(), ".2f"), ", mean steps", format(steps[-last:].mean(), ".1f"))
+    if monitor is not None:
+        print("stopped early:", monitor.reason if monitor.converged else "no, did not converge in " + str(args.episodes) + " episodes")
@@ -0,0 +1,67 @@
+'''
+    File name: test_batch_sarsan.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+import pytest
+import BatchSARSAn
+import Grid
+import Gridworlds
+import SARSAn
+
+class ScriptedRandom:
+    """
+    One sequence of (uniform, action) pairs for both interfaces: Rng.RandomStream (random, action) for SARSAn
+    and the gridworld, numpy.random.Generator (random, integers with size) for BatchSARSAn and its
+    BatchGridworld with one agent. The action belongs to the last uniform number, so it does not matter that
+    BatchSARSAn draws an action every time and SARSAn only when it takes a random one.
+    """
+
+    def __init__(self,seed,n_actions = 4):
+        self.generator = np.random.default_rng(seed)
+        self.n_actions = n_actions
+        self.last_action = None
+
+    def random(self,size = None):
+        value = self.generator.random()
+        self.last_action = int(self.generator.integers(self.n_actions))
+        return value if size is None else np.full(size, value)
+
+    def action(self):
+        return self.last_action
+
+    def integers(self,high,size = None):
+        return self.last_action if size is None else np.full(size, self.last_action)
+
+@pytest.mark.parametrize("gridworld", range(len(Gridworlds.Gridworlds.GRIDWORLD)))
+@pytest.mark.parametrize("n", [1, 2, 3, 10])
+@pytest.mark.parametrize("decreasing_epsilon", [False, True])
+def test_one_agent_like_sarsan(gridworld, n, decreasing_epsilon):
+    """
+    with the same random numbers one agent of BatchSARSAn does the same steps and updates as SARSAn,
+    also the updates at the terminal state that BatchSARSAn does for all finished agents at once
+    """
+    layout = Gridworlds.Gridworlds.GRIDWORLD[gridworld]
+    world = Grid.Gridworld(layout, rng = 0)
+    player = SARSAn.SARSAn(world, n = n, epsilon = 0.3, decreasing_epsilon = decreasing_epsilon, headless = True, rng = 1)
+    batch = BatchSARSAn.BatchSARSAn(layout, n_agents = 1, n = n, epsilon = 0.3, decreasing_epsilon = decreasing_epsilon, rng = 1)
+    batch.q[0] = player.q
+
+    script = ScriptedRandom(2)
+    player.random = script
+    world.random = script
+    batch_script = ScriptedRandom(2)
+    batch.random = batch_script
+    batch.environments.rng = batch_script
+
+    _, returns, steps = player.start(episodes = 15, evaluation = False)
+    _, batch_returns, batch_steps = batch.start(episodes = 15)
+
+    np.testing.assert_array_equal(batch_steps[0], steps)
+    np.testing.assert_allclose(batch_returns[0], returns, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(batch.q[0], player.q, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(batch.epsilon[0], player.epsilon, rtol=1e-12)
@@ -0,0 +1,51 @@
+'''
+    File name: test_buffers.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+import pytest
+import Buffers
+
+def reference(rewards, tau, n, gamma):
+    """
+    the n-step return of step tau as SARSAn calculated it before DiscountedReturn
+    """
+    end = len(rewards) if n == np.inf else min(tau + int(n), len(rewards))
+    return sum([gamma**(i-tau) * rewards[i] for i in range(tau, end)])
+
+@pytest.mark.parametrize("n", [1, 2, 5, np.inf])
+def test_discounted_return_like_reference(n):
+    """
+    random episodes of random lengths, the returns are popped in the order of SARSAn.episode
+    """
+    random = np.random.default_rng(0)
+    gamma = 0.9
+    discounted_return = Buffers.DiscountedReturn(gamma, n)
+
+    for _ in range(30):
+        discounted_return.reset()
+        # also longer than the initial capacity, so the Monte Carlo buffer has to grow
+        rewards = random.normal(size=random.integers(1, 150)).tolist()
+
+        returns = []
+        for t, reward in enumerate(rewards):
+            discounted_return.append(reward)
+            # one return n steps behind while the terminal state is not found
+            if n != np.inf and t + 1 < len(rewards) and len(returns) + n <= t:
+                returns.append(discounted_return.pop())
+        discounted_return.finish()
+        while len(returns) < len(rewards):
+            returns.append(discounted_return.pop())
+
+        expected = [reference(rewards, tau, n, gamma) for tau in range(len(rewards))]
+        np.testing.assert_allclose(returns, expected, rtol=1e-12, atol=1e-12)
+
+def test_discounted_return_needs_rewards():
+    discounted_return = Buffers.DiscountedReturn(0.9, 3)
+    discounted_return.append(1.0)
+    with pytest.raises(ValueError):
+        discounted_return.pop()
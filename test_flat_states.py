@@ -0,0 +1,53 @@
+'''
+    File name: test_flat_states.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+import pytest
+import Grid
+import Gridworlds
+import SARSAn
+
+def train(layout, flat_states, episodes = 20, **kwargs):
+    """
+    trains a headless agent with fixed seeds and returns it with the statistics of start
+    """
+    world = Grid.Gridworld(layout, rng = 1, flat_states = flat_states)
+    player = SARSAn.SARSAn(world, headless = True, rng = 2, **kwargs)
+    return player, player.start(episodes = episodes, evaluation = False)
+
+@pytest.mark.parametrize("gridworld", range(len(Gridworlds.Gridworlds.GRIDWORLD)))
+@pytest.mark.parametrize("n", [1, 3, 10, np.inf])
+def test_same_learning_with_flat_states(gridworld, n):
+    """
+    with the same seeds flat states give exactly the same episodes and q-values
+    """
+    layout = Gridworlds.Gridworlds.GRIDWORLD[gridworld]
+    grid_player, (grid_average, grid_returns, grid_steps) = train(layout, False, n = n, decreasing_epsilon = True)
+    flat_player, (flat_average, flat_returns, flat_steps) = train(layout, True, n = n, decreasing_epsilon = True)
+
+    np.testing.assert_array_equal(flat_steps, grid_steps)
+    np.testing.assert_array_equal(flat_returns, grid_returns)
+    np.testing.assert_array_equal(flat_average, grid_average)
+    np.testing.assert_array_equal(flat_player.getQ(), grid_player.getQ())
+
+def test_same_learning_with_flat_states_and_planning():
+    grid_player, (_, grid_returns, grid_steps) = train(Gridworlds.Gridworlds.GRIDWORLD0, False, planning_steps = 5)
+    flat_player, (_, flat_returns, flat_steps) = train(Gridworlds.Gridworlds.GRIDWORLD0, True, planning_steps = 5)
+
+    np.testing.assert_array_equal(flat_steps, grid_steps)
+    np.testing.assert_array_equal(flat_returns, grid_returns)
+    np.testing.assert_array_equal(flat_player.getQ(), grid_player.getQ())
+
+def test_flat_q_layout():
+    player, _ = train(Gridworlds.Gridworlds.GRIDWORLD0, True, episodes = 2)
+    world = player.gridworld
+
+    assert player.q.shape == (world.getNumStates(), len(world.getActions()))
+    assert player.q.flags.c_contiguous
+    assert np.shares_memory(player.getQ(), player.q)
+    assert player.getQ().shape == (len(world.getActions()), world.getYdim(), world.getXdim())
@@ -0,0 +1,64 @@
+'''
+    File name: test_kernel.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import numpy as np
+import pytest
+import Grid
+import Gridworlds
+import Kernel
+import SARSAn
+
+class ScriptedRandom:
+    """
+    One sequence of random numbers for both interfaces: Rng.RandomStream (random, action) for SARSAn and
+    the gridworld, numpy.random.Generator (random, integers) for Kernel.runEpisode, so both draw the same numbers
+    """
+
+    def __init__(self,seed,n_actions = 4):
+        self.generator = np.random.default_rng(seed)
+        self.n_actions = n_actions
+
+    def random(self):
+        return self.generator.random()
+
+    def action(self):
+        return int(self.generator.integers(self.n_actions))
+
+    def integers(self,low,high):
+        return low + int(self.generator.integers(high - low))
+
+def createPlayer(layout, n, compiled):
+    world = Grid.Gridworld(layout, rng = 0)
+    player = SARSAn.SARSAn(world, n = n, epsilon = 0.3, headless = True, rng = 1, compiled = compiled)
+    # the same random numbers for the policy and the gridworld, in the order they are drawn
+    script = ScriptedRandom(2)
+    player.random = script
+    world.random = script
+    return player
+
+@pytest.mark.parametrize("gridworld", range(len(Gridworlds.Gridworlds.GRIDWORLD)))
+@pytest.mark.parametrize("n", [1, 3, 10, np.inf])
+def test_kernel_like_episode(monkeypatch, gridworld, n):
+    """
+    the python version of the kernel does the same updates as SARSAn.episode
+    """
+    # without numba the functions are not compiled and have no py_func
+    monkeypatch.setattr(Kernel, "epsilonGreedy", getattr(Kernel.epsilonGreedy, "py_func", Kernel.epsilonGreedy))
+    monkeypatch.setattr(Kernel, "runEpisode", getattr(Kernel.runEpisode, "py_func", Kernel.runEpisode))
+
+    layout = Gridworlds.Gridworlds.GRIDWORLD[gridworld]
+    player = createPlayer(layout, n, compiled = False)
+    kernel_player = createPlayer(layout, n, compiled = True)
+    np.testing.assert_array_equal(kernel_player.q, player.q)
+
+    for _ in range(10):
+        _, returns, steps = player.episode()
+        _, kernel_returns, kernel_steps = kernel_player.episode()
+        assert kernel_steps == steps
+        assert kernel_returns == pytest.approx(returns, abs=1e-9)
+        np.testing.assert_allclose(kernel_player.q, player.q, rtol=1e-12, atol=1e-12)
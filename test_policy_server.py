@@ -0,0 +1,75 @@
+'''
+    File name: test_policy_server.py
+    Author: Eosandra Grund
+    Date created: 18.10.2026
+    Date last modified: 18.10.2026
+    Python Version: 3.10.4
+'''
+
+import asyncio
+import json
+import numpy as np
+import pytest
+import PolicyServer
+
+def createQ():
+    """
+    q-values of a 3 x 5 gridworld where action (y+x) % 4 is the best one
+    """
+    q = np.zeros(shape=(4,3,5))
+    y, x = np.indices((3,5))
+    q[(y + x) % 4, y, x] = 1
+    return q
+
+async def ask(lines):
+    """
+    sends the lines to a new server over TCP and returns its answers by id
+    """
+    server = PolicyServer.PolicyServer(createQ())
+    listening = await server.start(port=0)
+    host, port = listening.sockets[0].getsockname()[:2]
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+        for line in lines:
+            writer.write((line + "\n").encode())
+        await writer.drain()
+        answers = {}
+        for _ in lines:
+            answer = json.loads(await asyncio.wait_for(reader.readline(), timeout=5))
+            answers[answer["id"]] = answer
+        writer.close()
+        await writer.wait_closed()
+    finally:
+        await server.close()
+    return answers
+
+def test_actions():
+    answers = asyncio.run(ask(['{"id": 1, "states": [[0,0],[2,4],[1,2]]}', '{"id": 2, "states": []}']))
+    assert answers[1]["actions"] == [0, 2, 3]
+    assert answers[2]["actions"] == []
+
+@pytest.mark.parametrize("states", [
+    "[[3,0]]", # outside of the gridworld
+    "[[0,-1]]",
+    "[[1e30,0]]", # float
+    "[[0.5,0]]",
+    "[[" + str(10**22) + ",0]]", # too large for int64
+    "[[" + str(2**64 - 1) + ",0]]", # uint64 that wraps to -1
+    "[[1,2],[3]]", # not pairs
+    "[[1,2,3]]",
+    '"states"',
+    "null",
+])
+def test_invalid_states(states):
+    """
+    an invalid request gets an error and the server still answers the next one
+    """
+    answers = asyncio.run(ask(['{"id": 1, "states": ' + states + '}', '{"id": 2, "states": [[0,1]]}']))
+    assert "error" in answers[1]
+    assert answers[2]["actions"] == [1]
+
+def test_malformed_request():
+    answers = asyncio.run(ask(['{"id": 1, "states": [[0,0]', '[1, 2]', '{"id": 3}', '{"id": 4, "states": [[0,3]]}']))
+    assert "error" in answers[None]
+    assert "error" in answers[3]
+    assert answers[4]["actions"] == [3]